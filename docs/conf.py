@@ -64,24 +64,46 @@ except ImportError:
 
 output_dir = os.path.join(__location__, "api")
 module_dir = os.path.join(__location__, "../src/qa_analytics_insights")
-try:
-    shutil.rmtree(output_dir)
-except FileNotFoundError:
-    pass
 
-try:
-    import sphinx
 
-    cmd_line = f"sphinx-apidoc --implicit-namespaces -f -o {output_dir} {module_dir}"
+def apidoc_is_outdated() -> bool:
+    """Return True if the API docs are older than any of the module sources.
 
-    args = cmd_line.split(" ")
-    if tuple(sphinx.__version__.split(".")) >= ("3", "5", "2"):
-        # This is a rudimentary parse_version to avoid external dependencies
-        args = args[1:]
-
-    apidoc.main(args)
-except Exception as e:
-    print(f"Running `sphinx-apidoc` failed!\n{e}")
+    A module added or removed changes the mtime of the module directory.
+    Set QAAI_FORCE_APIDOC=1 to always regenerate the API docs.
+    """
+    if os.environ.get("QAAI_FORCE_APIDOC") == "1" or not os.path.isdir(output_dir):
+        return True
+    output_mtime = os.path.getmtime(output_dir)
+    if os.path.getmtime(module_dir) > output_mtime:
+        return True
+    return any(
+        os.path.getmtime(os.path.join(root, name)) > output_mtime
+        for root, _, names in os.walk(module_dir)
+        for name in names
+        if name.endswith(".py")
+    )
+
+
+if apidoc_is_outdated():
+    try:
+        shutil.rmtree(output_dir)
+    except FileNotFoundError:
+        pass
+
+    try:
+        import sphinx
+
+        cmd_line = f"sphinx-apidoc --implicit-namespaces -f -o {output_dir} {module_dir}"
+
+        args = cmd_line.split(" ")
+        if tuple(sphinx.__version__.split(".")) >= ("3", "5", "2"):
+            # This is a rudimentary parse_version to avoid external dependencies
+            args = args[1:]
+
+        apidoc.main(args)
+    except Exception as e:
+        print(f"Running `sphinx-apidoc` failed!\n{e}")
 
 # -- General configuration ---------------------------------------------------
 
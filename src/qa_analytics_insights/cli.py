@@ -5,6 +5,7 @@ Command line interface for the qa-analytics-insights package.
 
 import argparse
 import sys
+from functools import cached_property, lru_cache
 from typing import List, Optional  # noqa: F401
 
 from loguru import logger
@@ -22,11 +23,6 @@ from qa_analytics_insights.result_visualizer import ParallelResultVisualizer
 class ArgsParser:
     """Class for handling command line arguments."""
 
-    def __init__(self) -> None:
-        """Initialize the ArgsParser class."""
-        self._parser = None  # type: Optional[argparse.ArgumentParser]
-        self._args = None  # type: Optional[argparse.Namespace]
-
     def add_arguments(self) -> argparse.ArgumentParser:
         """Add command line arguments."""
         parser = argparse.ArgumentParser(
@@ -66,29 +62,42 @@ class ArgsParser:
             dest="verbose",
             help="Enable verbose logging.",
         )
+        parser.add_argument(
+            "--log-file",
+            dest="log_file",
+            type=str,
+            default=None,
+            help="Path to a file to write the debug log to.",
+        )
         return parser
 
-    @property
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _build_parser(cls) -> argparse.ArgumentParser:
+        """Build the parser once for every instance of the class.
+
+        Returns:
+            ArgumentParser object.
+        """
+        return cls().add_arguments()
+
+    @cached_property
     def parser(self) -> argparse.ArgumentParser:
         """Return the parser object.
 
         Returns:
             ArgumentParser object.
         """
-        if not self._parser:
-            self._parser = self.add_arguments()
-        return self._parser
+        return self._build_parser()
 
-    @property
+    @cached_property
     def args(self) -> argparse.Namespace:
         """Return the parsed arguments.
 
         Returns:
             Namespace object.
         """
-        if not self._args:
-            self._args = self.parser.parse_args()
-        return self._args
+        return self.parser.parse_args()
 
     def help(self) -> None:
         """Print help message."""
@@ -105,7 +114,7 @@ class Cli:
     def __init__(self) -> None:
         """Initialize the cli class."""
         self.args_parser = ArgsParser()
-        self.args = self.args_parser.args
+        self.args = None  # type: Optional[argparse.Namespace]
 
     def run(self, file_path: str, output: str = "test_results_visualization") -> None:
         """Main execution method."""
@@ -128,16 +137,15 @@ class Cli:
             return None
         self.args = self.args_parser.parser.parse_args(args)
         if self.args.verbose:
-            verbose_logging()
+            verbose_logging(self.args.log_file)
             logger.info("Log level set to DEBUG.")
         else:
-            default_logging()
+            default_logging(self.args.log_file)
             logger.info("Log level set to INFO.")
         if self.args.file_path is None:
             self.args_parser.help()
             return None
         logger.info("Starting for creating the visualization...")
-        logger
         self.run(self.args.file_path, self.args.output)
         logger.info("Visualization created successfully.")
 
@@ -3,12 +3,25 @@
 This file contains the data classes used in the qa-analytics-insights package.
 """
 
-from concurrent.futures import ThreadPoolExecutor
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional  # noqa: F401
 
+# Slotted data classes avoid a per-instance __dict__, which matters as one
+# TestCase is created per test in the reports. Slots require Python 3.10.
+_DATACLASS_OPTIONS = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)  # type: Dict[str, Any]
 
-@dataclass
+# Results of a test case. The parser shares these interned string objects
+# between all test cases, results are still compared by equality.
+PASSED = "passed"
+FAILED = "failed"
+SKIPPED = "skipped"
+ERROR = "error"
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class TestCase:
     """Represents a test case.
 
@@ -28,7 +41,7 @@ class TestCase:
     test_module: Optional[str] = None
     test_class: Optional[str] = None
     execution_time: float = 0.0
-    result: str = "passed"
+    result: str = PASSED
     timestamp: Optional[str] = None
     failure_reason: Optional[str] = None
     error_reason: Optional[str] = None
@@ -36,7 +49,7 @@ class TestCase:
     system_out: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TestClass:
     """Represents a test class.
 
@@ -70,32 +83,28 @@ class TestClass:
         This method calculates the number of passed, failed, skipped and
         error tests in the test class.
         """
-        with ThreadPoolExecutor() as executor:
-            executor.map(self._calculate_test_class_metrics, self.test_cases)
-
-    def _calculate_test_class_metrics(self, test_case: TestCase) -> None:
-        """Calculates the number of passed, failed, skipped and
-        error tests in the test class.
-
-        Args:
-            test_case: Test case to be analyzed.
-        """
-        if test_case.result == "passed":
-            self.passed += 1
-        if test_case.result == "failed":
-            self.failed += 1
-            self.failed_test_cases.append(test_case)
-        if test_case.result == "skipped":
-            self.skipped += 1
-            self.skipped_test_cases.append(test_case)
-        if test_case.result == "error":
-            self.errors += 1
-            self.error_test_cases.append(test_case)
-
-        self.execution_time += test_case.execution_time
-
-
-@dataclass
+        buckets = {
+            PASSED: [],
+            FAILED: [],
+            SKIPPED: [],
+            ERROR: [],
+        }  # type: Dict[str, List[TestCase]]
+        execution_time = 0.0
+        for test_case in self.test_cases:
+            buckets.setdefault(test_case.result, []).append(test_case)
+            execution_time += test_case.execution_time
+
+        self.passed = len(buckets[PASSED])
+        self.failed = len(buckets[FAILED])
+        self.skipped = len(buckets[SKIPPED])
+        self.errors = len(buckets[ERROR])
+        self.failed_test_cases = buckets[FAILED]
+        self.skipped_test_cases = buckets[SKIPPED]
+        self.error_test_cases = buckets[ERROR]
+        self.execution_time = execution_time
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class TestSuite:
     """Represents a test suite.
 
@@ -109,7 +118,6 @@ class TestSuite:
         timestamp: Timestamp of the test suite.
         test_classes: List of test classes in the test suite.
         test_cases: List of ungrouped test cases in the test suite.
-        passed: Number of passed tests in the test suite.
     """
 
     name: Optional[str] = field(default=None)
@@ -121,8 +129,12 @@ class TestSuite:
     timestamp: Optional[str] = field(default=None)
     test_classes: List[TestClass] = field(default_factory=list)
     test_cases: List[TestCase] = field(default_factory=list)
-    passed: int = field(init=False, default=0)
 
-    def __post_init__(self) -> None:
-        """Calculates the number of passed tests in the test suite."""
-        self.passed = self.tests - self.errors - self.failures - self.skipped
+    @property
+    def passed(self) -> int:
+        """Calculates the number of passed tests in the test suite.
+
+        Returns:
+            Number of passed tests in the test suite.
+        """
+        return self.tests - self.errors - self.failures - self.skipped
@@ -4,25 +4,60 @@ This module is responsible for logging.
 """
 
 import functools
+import os
 import sys
 import time
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 from loguru import logger
 
+# Environment variable enabling the log file when no log file is given.
+LOG_FILE_ENV = "QAAI_LOG_FILE"
 
-def verbose_logging() -> None:
-    """loguru verbose."""
+
+def add_log_file(log_file: Optional[str] = None) -> None:
+    """Add a DEBUG level log file sink if a log file is requested.
+
+    The log file is written from a background thread so that logging
+    does not wait for disk I/O, and without the variable values and extended
+    tracebacks that are costly to collect on every logged exception.
+
+    Args:
+        log_file: Path to the log file. Defaults to the QAAI_LOG_FILE
+            environment variable, no log file is written if neither is set.
+    """
+    log_file = log_file or os.environ.get(LOG_FILE_ENV)
+    if log_file:
+        logger.add(
+            log_file,
+            level="DEBUG",
+            rotation="1 day",
+            enqueue=True,
+            backtrace=False,
+            diagnose=False,
+        )
+
+
+def verbose_logging(log_file: Optional[str] = None) -> None:
+    """loguru verbose.
+
+    Args:
+        log_file: Path to the log file.
+    """
     logger.remove()
     logger.add(sys.stderr, level="DEBUG")
-    logger.add("outputs/qa_analytics_insights.log", level="DEBUG", rotation="1 day")
+    add_log_file(log_file)
 
 
-def default_logging() -> None:
-    """loguru default."""
+def default_logging(log_file: Optional[str] = None) -> None:
+    """loguru default.
+
+    Args:
+        log_file: Path to the log file.
+    """
     logger.remove()
     logger.add(sys.stderr, level="INFO")
-    logger.add("outputs/qa_analytics_insights.log", level="DEBUG", rotation="1 day")
+    add_log_file(log_file)
 
 
 def log_execution_time(method: Callable[..., Any]) -> Callable[..., Any]:
@@ -47,9 +82,9 @@ def log_execution_time(method: Callable[..., Any]) -> Callable[..., Any]:
         Returns:
             The result of the method.
         """
-        start = time.time()
+        start = time.perf_counter()
         result = method(*args, **kwargs)
-        end = time.time()
+        end = time.perf_counter()
         duration = end - start
 
         logger.info(f"{method.__name__} executed in {duration:.2f} seconds.")
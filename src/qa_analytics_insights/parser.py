@@ -4,12 +4,34 @@ This module is responsible for parsing test cases from XML tags.
 """
 
 import re
-from typing import Optional
+import sys
+from functools import cached_property
+from typing import Dict, Optional  # noqa: F401
 from xml.etree import ElementTree as ET
 
 from loguru import logger
 
-from qa_analytics_insights.data_classes import TestCase, TestSuite
+from qa_analytics_insights.data_classes import (
+    ERROR,
+    FAILED,
+    PASSED,
+    SKIPPED,
+    TestCase,
+    TestSuite,
+)
+
+# Timestamp at the start of the system-out, in the format YYYYMMDD HH:MM:SS.
+_TIMESTAMP_RE = re.compile(r"(\d{8} \d{2}:\d{2}:\d{2})")
+
+
+def _to_int(value: Optional[str]) -> int:
+    """Convert an attribute value to int, a missing or empty value is 0."""
+    return int(value) if value else 0
+
+
+def _to_float(value: Optional[str]) -> float:
+    """Convert an attribute value to float, a missing or empty value is 0.0."""
+    return float(value) if value else 0.0
 
 
 class ParserTestSuite:
@@ -29,17 +51,14 @@ class ParserTestSuite:
         Returns:
             TestSuite object.
         """
-        suite_name = self.test_suite.attrib.get("name", "")
-        suite_tests = int(self.test_suite.attrib.get("tests", 0))
-        suite_errors = int(self.test_suite.attrib.get("errors", 0))
-        suite_failures = int(self.test_suite.attrib.get("failures", 0))
-        suite_skipped = int(
-            self.test_suite.attrib.get("skip")
-            or self.test_suite.attrib.get("skipped")
-            or 0
-        )
-        suite_execution_time = float(self.test_suite.attrib.get("time", 0))
-        suite_timestamp = self.test_suite.attrib.get("timestamp", "")
+        attrib = self.test_suite.attrib
+        suite_name = attrib.get("name", "")
+        suite_tests = _to_int(attrib.get("tests"))
+        suite_errors = _to_int(attrib.get("errors"))
+        suite_failures = _to_int(attrib.get("failures"))
+        suite_skipped = _to_int(attrib.get("skip") or attrib.get("skipped"))
+        suite_execution_time = _to_float(attrib.get("time"))
+        suite_timestamp = attrib.get("timestamp", "")
 
         test_suite = TestSuite(
             name=suite_name,
@@ -54,6 +73,136 @@ class ParserTestSuite:
         return test_suite
 
 
+def _first_children(test_case: ET.Element) -> Dict[str, ET.Element]:
+    """Return the first child tag of each kind, collected in one scan."""
+    children = {}  # type: Dict[str, ET.Element]
+    for child in test_case:
+        children.setdefault(child.tag, child)
+    return children
+
+
+def _child_attribute(
+    children: Dict[str, ET.Element], tag: str, attrib: Optional[str] = None
+) -> Optional[str]:
+    """Return the attribute, or the text if attrib is None, of a child tag."""
+    found_tag = children.get(tag)
+    if found_tag is None:
+        return None
+    if attrib is not None:
+        return found_tag.get(attrib)
+    return found_tag.text
+
+
+def _testcase_result(children: Dict[str, ET.Element]) -> str:
+    """Return the test case result from its child tags."""
+    if "failure" in children:
+        return FAILED
+    if "skipped" in children:
+        return SKIPPED
+    if "error" in children:
+        return ERROR
+    return PASSED
+
+
+def _failure_reason(
+    test_case: ET.Element, failure_message: Optional[str], tag: str
+) -> Optional[str]:
+    """Return the first line of a failure or error message."""
+    if not failure_message:
+        logger.debug(
+            "{} message not found in {} tag. Test case: {}",
+            tag.upper(),
+            tag,
+            test_case.text,
+        )
+        return None
+    # The failure reason is the first line, the rest is captured logging
+    return failure_message.lstrip().partition("\n")[0].rstrip()
+
+
+def _skipped_reason(
+    test_case: ET.Element, skipped_message: Optional[str]
+) -> Optional[str]:
+    """Return the skipped message."""
+    if skipped_message:
+        return skipped_message
+    logger.debug(
+        "Skipped message not found in skipped tag. Test case: {}", test_case.text
+    )
+    return None
+
+
+def _timestamp(
+    timestamp_found: Optional[str], system_out: Optional[str]
+) -> Optional[str]:
+    """Return the timestamp tag text or the timestamp starting the system-out."""
+    if timestamp_found is not None:
+        return timestamp_found
+    # Sometimes the timestamp is in the first line of the system-out tag
+    if system_out:
+        timestamp_text = system_out.lstrip().partition("\n")[0]
+        timestamp_match = _TIMESTAMP_RE.match(timestamp_text)
+        if timestamp_match:
+            return timestamp_match.group(0)
+    return None
+
+
+def parse_testcase(test_case: ET.Element) -> TestCase:
+    """Parses a testcase tag into a TestCase object.
+
+    This is the per-testcase path of XMLParser, the children of the tag are
+    scanned once and no ParserTestCase object is created.
+
+    Args:
+        test_case: XML tag of the test case.
+
+    Returns:
+        TestCase object.
+    """
+    children = _first_children(test_case)
+    get = test_case.attrib.get
+    # The classname is "<package>.<module>.<class>", the package is optional
+    module_path, _, test_class_name = get("classname", "").rpartition(".")
+    # Module and class names repeat across test cases, share one string each
+    test_class_name = sys.intern(test_class_name)
+    test_module_name = sys.intern(module_path.rpartition(".")[2])
+
+    test_case_result = _testcase_result(children)
+    failure_reason = None
+    error_reason = None
+    skipped_reason = None
+    if test_case_result == FAILED:
+        failure_reason = _failure_reason(
+            test_case, _child_attribute(children, "failure", "message"), "failure"
+        )
+    elif test_case_result == ERROR:
+        error_reason = _failure_reason(
+            test_case, _child_attribute(children, "error", "message"), "error"
+        )
+    elif test_case_result == SKIPPED:
+        skipped_reason = _skipped_reason(
+            test_case, _child_attribute(children, "skipped", "message")
+        )
+
+    # The system out is the text after the CDATA
+    system_out = _child_attribute(children, "system-out") or None
+    time_stamp = _timestamp(_child_attribute(children, "timestamp"), system_out)
+
+    # Positional arguments in the TestCase field order
+    return TestCase(
+        get("name", ""),
+        test_module_name,
+        test_class_name,
+        _to_float(get("time")),
+        test_case_result,
+        time_stamp,
+        failure_reason,
+        error_reason,
+        skipped_reason,
+        system_out,
+    )
+
+
 class ParserTestCase:
     """Responsible for parsing TestCase objects from XML tags."""
 
@@ -65,65 +214,33 @@ class ParserTestCase:
         """
         self.test_case = test_case
 
+    @cached_property
+    def children(self) -> Dict[str, ET.Element]:
+        """Return the first child tag of each kind, collected in one scan.
+
+        Returns:
+            Child tags of the test case by tag name.
+        """
+        return _first_children(self.test_case)
+
     def parse(self) -> TestCase:
         """Parses the XML tag into TestCase object.
 
         Returns:
             TestCase object.
         """
-        test_class_name = self.test_case.attrib.get("classname", "")
-        if test_class_name:
-            test_class_name = test_class_name.split(".")[-1]
-
-        test_module_name = self.test_case.attrib.get("classname", "")
-        if test_module_name:
-            test_module_name = test_module_name.split(".")[-2]
-
-        test_case_name = self.test_case.attrib.get("name", "")
-        test_case_time = float(self.test_case.attrib.get("time", 0))
-        test_case_result = self.get_testcase_result()
-
-        failure_reason = None
-        error_reason = None
-        skipped_reason = None
-        if test_case_result == "failed":
-            failure_reason = self.get_failure_reason()
-        if test_case_result == "error":
-            error_reason = self.get_failure_reason(tag="error")
-
-        if test_case_result == "skipped":
-            skipped_reason = self.get_skipped_reason()
-
-        system_out = self.get_system_out()
-        time_stamp = self.get_timestamp()
-
-        return TestCase(
-            name=test_case_name,
-            test_module=test_module_name,
-            test_class=test_class_name,
-            execution_time=test_case_time,
-            result=test_case_result,
-            timestamp=time_stamp,
-            failure_reason=failure_reason,
-            error_reason=error_reason,
-            skipped_reason=skipped_reason,
-            system_out=system_out,
-        )
+        return parse_testcase(self.test_case)
 
     def get_testcase_result(self) -> str:
         """Parses the test case result from the test case tag.
 
+        A failure tag takes precedence over a skipped tag, which takes
+        precedence over an error tag.
+
         Returns:
             Test case result.
         """
-        result = "passed"
-        if self.test_case.find("failure") is not None:
-            result = "failed"
-        elif self.test_case.find("skipped") is not None:
-            result = "skipped"
-        elif self.test_case.find("error") is not None:
-            result = "error"
-        return result
+        return _testcase_result(self.children)
 
     def find_tag_attribute(
         self, tag: str, attrib: Optional[str] = None
@@ -137,13 +254,7 @@ class ParserTestCase:
         Returns:
             Find the tag and return the attribute or text.
         """
-        found_tag = self.test_case.find(tag)
-        if found_tag is None:
-            return None
-        if attrib is not None:
-            attrib_text = found_tag.get(attrib)
-            return attrib_text
-        return found_tag.text
+        return _child_attribute(self.children, tag, attrib)
 
     def get_failure_reason(self, tag: str = "failure") -> Optional[str]:
         """Parse the failure reason from a failure tag.
@@ -154,26 +265,9 @@ class ParserTestCase:
         Returns:
             Failure reason.
         """
-        failure_message = self.find_tag_attribute(tag, "message")
-        if not failure_message:
-            logger.debug(
-                f"{tag.upper()} message not found in {tag} tag. "
-                f"Test case: {self.test_case.text}"
-            )
-            return None
-        try:
-            # Try to extract the failure reason from the failure message
-            split_by_captured_logging = failure_message.strip().split("\n")
-            if split_by_captured_logging:
-                failure_reason = split_by_captured_logging[0]
-                return failure_reason
-        except Exception as message_parse_exception:
-            logger.warning(
-                f"Could not parse {tag} reason from {tag} message."
-                f"Exception: {message_parse_exception}"
-            )
-            logger.warning(f"Test case: {self.test_case.text}")
-        return failure_message
+        return _failure_reason(
+            self.test_case, self.find_tag_attribute(tag, "message"), tag
+        )
 
     def get_skipped_reason(self, tag: str = "skipped") -> Optional[str]:
         """Parse the skipped reason from a skipped tag.
@@ -184,14 +278,7 @@ class ParserTestCase:
         Returns:
             Skipped reason.
         """
-        skipped_message = self.find_tag_attribute(tag, "message")
-        if skipped_message:
-            return skipped_message
-
-        logger.debug(
-            "Skipped message not found in skipped tag. Test case: {test_case.text}"
-        )
-        return None
+        return _skipped_reason(self.test_case, self.find_tag_attribute(tag, "message"))
 
     def get_timestamp(self, tag: str = "system-out") -> Optional[str]:
         """Parse the timestamp from a system-out tag or timestamp tag.
@@ -202,27 +289,9 @@ class ParserTestCase:
         Returns:
             Timestamp or None if no timestamp is found.
         """
-        # check if any timestamp tag exists
-        timestamp_found = self.find_tag_attribute(tag="timestamp")
-        if timestamp_found is not None:
-            logger.debug(f"Tag timestamp found: {timestamp_found}")
-            return timestamp_found
-        logger.debug(f"Tag timestamp not found: {timestamp_found}")
-        logger.debug(f"Parsing timestamp from {tag} tag...")
-
-        system_out_tag = self.find_tag_attribute(tag)
-        # Sometimes the timestamp is in the first line of the system-out tag
-        if system_out_tag:
-            timestamp_text = system_out_tag.strip().split("\n")[0]
-            # Extract timestamp using regex
-            # assuming it's in the format YYYYMMDD HH:MM:SS
-            timestamp_match = re.match(r"(\d{8} \d{2}:\d{2}:\d{2})", timestamp_text)
-            if timestamp_match:
-                logger.debug(f"Found timestamp: {timestamp_match.group(0)}")
-                return timestamp_match.group(0)
-
-        logger.debug(f"Timestamp not parsed. Unexpected system-out: {system_out_tag}.")
-        return None
+        return _timestamp(
+            self.find_tag_attribute(tag="timestamp"), self.find_tag_attribute(tag)
+        )
 
     def get_system_out(self, tag: str = "system-out") -> Optional[str]:
         """Parse the system out from a system-out tag.
@@ -236,11 +305,4 @@ class ParserTestCase:
         system_out_tag = self.find_tag_attribute(tag)
 
         # The system out is the text after the CDATA
-        if system_out_tag:
-            system_out_text = system_out_tag
-            return system_out_text
-
-        logger.debug(
-            f"Could not parse system out from system-out tag: {system_out_tag}"
-        )
-        return None
+        return system_out_tag or None
@@ -3,8 +3,9 @@
 This module is responsible for fetching paths from the given initial path.
 """
 
+import os
 from pathlib import Path
-from queue import Queue
+from typing import List  # noqa: F401
 
 from loguru import logger
 
@@ -23,22 +24,34 @@ class PathFetcher:
             initial_path: Initial path to fetch paths from.
         """
         self.initial_path = Path(initial_path)
-        self.queue = Queue()  # type: Queue[Path]
+        self.paths = []  # type: List[Path]
 
-    def fetch_paths(self) -> Queue[Path]:
+    def fetch_paths(self) -> List[Path]:
         """Fetches paths from the given initial path.
 
+        Only non-empty XML files are fetched from a directory.
+
         Returns:
-            Queue of paths.
+            List of paths.
         """
         try:
             if self.initial_path.is_file():
-                self.queue.put(self.initial_path)
+                self.paths.append(self.initial_path)
             elif self.initial_path.is_dir():
-                for file_path in self.initial_path.iterdir():
-                    self.queue.put(file_path)
+                # DirEntry caches the file type, only XML files are stat'ed
+                # for their size
+                with os.scandir(self.initial_path) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith(".xml"):
+                            continue
+                        # A file removed meanwhile is skipped, not the listing
+                        try:
+                            if entry.is_file() and entry.stat().st_size:
+                                self.paths.append(Path(entry.path))
+                        except OSError as e:
+                            logger.debug(f"Skipping {entry.path}: {e}")
             else:
                 logger.error(f"Invalid path: {self.initial_path}")
         except Exception as e:
             logger.exception(f"Error fetching paths: {str(e)}")
-        return self.queue
+        return self.paths
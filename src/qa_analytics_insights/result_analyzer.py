@@ -4,11 +4,18 @@ ResultAnalyzer implements the logic for analyzing the test results with
 different metrics which can be used to visualize the results.
 """
 
-from typing import List
+import heapq
+import operator
+import warnings
+from functools import cached_property
+from itertools import chain
+from typing import List, Optional  # noqa: F401
 
 from qa_analytics_insights.data_classes import TestCase, TestClass, TestSuite
 from qa_analytics_insights.xml_processor import XMLProcessor
 
+_EXECUTION_TIME = operator.attrgetter("execution_time")
+
 
 class ResultAnalyzer:
     """Analyzes the test results with several metrics.
@@ -21,45 +28,69 @@ class ResultAnalyzer:
         - execution times by test class in descending order
     """
 
-    def __init__(self, path: str, num_threads: int = 10) -> None:
+    def __init__(
+        self,
+        path: str,
+        num_workers: Optional[int] = None,
+        num_threads: Optional[int] = None,
+    ) -> None:
         """Initialize the ResultAnalyzer.
 
         Args:
             path: Path to the test result XML files.
-            num_threads: Number of threads to use for parsing the XML files.
+            num_workers: Number of workers to use for parsing the XML files.
+                Defaults to the number of CPUs.
+            num_threads: Deprecated alias of num_workers.
         """
+        if num_threads is not None:
+            warnings.warn(
+                "num_threads is deprecated, use num_workers instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            if num_workers is None:
+                num_workers = num_threads
         self.path = path
-        self.num_threads = num_threads
+        self.num_workers = num_workers
         self.processor = XMLProcessor(self.path)
-        self._suites = []  # type: List[TestSuite]
-        self._classes = []  # type: List[TestClass]
-        self._test_cases = []  # type: List[TestCase]
+        self._classes_by_execution_time = None  # type: Optional[List[TestClass]]
 
     @property
+    def num_threads(self) -> Optional[int]:
+        """Deprecated alias of num_workers.
+
+        Returns:
+            Number of workers to use for parsing the XML files.
+        """
+        warnings.warn(
+            "num_threads is deprecated, use num_workers instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.num_workers
+
+    @cached_property
     def suites(self) -> List[TestSuite]:
         """Return the test suites.
 
         Returns:
             List of TestSuite objects.
         """
-        if not self._suites:
-            self.process_test_results()
-            self._suites = self.processor.test_suites
-        return self._suites
+        self.process_test_results()
+        return self.processor.test_suites
 
-    @property
+    @cached_property
     def classes(self) -> List[TestClass]:
         """Return the test classes.
 
         Returns:
             List of TestClass objects.
         """
-        if not self._classes:
-            for test_suite in self.suites:
-                self._classes.extend(test_suite.test_classes)
-        return self._classes
+        return list(
+            chain.from_iterable(test_suite.test_classes for test_suite in self.suites)
+        )
 
-    @property
+    @cached_property
     def test_cases(self) -> List[TestCase]:
         """Return the test cases for all test suites.
 
@@ -68,20 +99,30 @@ class ResultAnalyzer:
         Returns:
             List of TestCase objects.
         """
-        if not self._test_cases:
-            for test_suite in self.suites:
-                self._test_cases.extend(test_suite.test_cases)
-                for test_class in self.classes:
-                    self._test_cases.extend(test_class.test_cases)
-        return self._test_cases
+        return list(
+            chain(
+                chain.from_iterable(
+                    test_suite.test_cases for test_suite in self.suites
+                ),
+                chain.from_iterable(
+                    test_class.test_cases for test_class in self.classes
+                ),
+            )
+        )
 
     def process_test_results(self) -> None:
         """Process the test result XML files and parse them into TestClass objects.
 
-        Returns:
-            List of TestSuites objects.
+        The previously processed test suites and the results derived from
+        them are reset.
         """
-        self.processor.process_files_in_parallel(self.num_threads)
+        # A new list, the previous one may still be referenced by callers
+        self.processor.test_suites = []
+        self.processor.process_files_in_parallel(self.num_workers)
+        self.suites = self.processor.test_suites
+        self.__dict__.pop("classes", None)
+        self.__dict__.pop("test_cases", None)
+        self._classes_by_execution_time = None
 
     def __len__(self) -> int:
         """Return the number of TestClass objects.
@@ -94,14 +135,16 @@ class ResultAnalyzer:
     def get_execution_times_by_test_class_in_descending_order(self) -> List[TestClass]:
         """Return the test classes sorted by execution time in descending order.
 
+        The sorted test classes are cached until the results are processed again.
+
         Returns:
             List of TestClass objects.
         """
-        return sorted(
-            self.classes,
-            key=lambda test_class: test_class.execution_time,
-            reverse=True,
-        )
+        if self._classes_by_execution_time is None:
+            self._classes_by_execution_time = sorted(
+                self.classes, key=_EXECUTION_TIME, reverse=True
+            )
+        return self._classes_by_execution_time
 
     def get_slowest_test_classes(self, num_test_classes: int = 10) -> List[TestClass]:
         """Return the slowest test classes.
@@ -112,6 +155,12 @@ class ResultAnalyzer:
         Returns:
             List of TestClass objects.
         """
-        return self.get_execution_times_by_test_class_in_descending_order()[
-            :num_test_classes
-        ]
+        if (
+            self._classes_by_execution_time is not None
+            or not 0 < num_test_classes < len(self.classes)
+        ):
+            return self.get_execution_times_by_test_class_in_descending_order()[
+                :num_test_classes
+            ]
+        # Select the slowest test classes without sorting all of them.
+        return heapq.nlargest(num_test_classes, self.classes, key=_EXECUTION_TIME)
@@ -7,21 +7,123 @@ from __future__ import annotations
 
 import base64
 import math
-from concurrent.futures import ThreadPoolExecutor
+import threading
 from datetime import datetime
+from html import escape
 from io import BytesIO
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
 
-import matplotlib
-import numpy as np
 from loguru import logger
-from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
+
+from qa_analytics_insights.data_classes import (
+    ERROR,
+    FAILED,
+    PASSED,
+    SKIPPED,
+    TestCase,
+    TestClass,
+    TestSuite,
+)
+
+# Pie chart slices of the test class results, in the order they are drawn.
+_PIE_LABELS = (SKIPPED, FAILED, PASSED, ERROR)
+_PIE_COLORS = ("gray", "red", "green", "orange")
+
+_FAILED_TABLE_COLUMNS = ("Test Class", "Test Name", "Failure Reason")
+_SKIPPED_TABLE_COLUMNS = ("Test Class", "Test Name", "Skipped Reason")
+_SUMMARY_TABLE_COLUMNS = (
+    "Test Suite",
+    "Total",
+    "Passed",
+    "Failed",
+    "Skipped",
+    "Errors",
+    "Time",
+)
+
+
+# PNG buffer reused by every figure rendered in the same thread.
+_BUFFERS = threading.local()
+
+
+def _png_buffer() -> BytesIO:
+    """Return the emptied PNG buffer of the current thread.
+
+    Returns:
+        The buffer to save a figure to.
+    """
+    buffer = getattr(_BUFFERS, "png", None)  # type: Optional[BytesIO]
+    if buffer is None:
+        buffer = _BUFFERS.png = BytesIO()
+    else:
+        buffer.seek(0)
+        buffer.truncate()
+    return buffer
+
+
+def html_table(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> str:
+    """Render table rows as an HTML table.
+
+    Args:
+        columns: Column headers of the table.
+        rows: Rows of cell values, None is rendered as an empty cell.
+
+    Returns:
+        The HTML table.
+    """
+    header = "".join(f"<th>{escape(column)}</th>" for column in columns)
+    body = "".join(
+        "<tr>"
+        + "".join(
+            f"<td>{'' if cell is None else escape(str(cell))}</td>" for cell in row
+        )
+        + "</tr>"
+        for row in rows
+    )
+    return (
+        '<table border="1" style="border-collapse: collapse; font-size: 8pt">'
+        f'<tr style="background-color: #DDEBF7">{header}</tr>{body}</table>'
+    )
+
+
+def svg_bar_chart(bars: Sequence[Tuple[str, float]]) -> str:
+    """Render a horizontal bar chart of execution times as an inline SVG.
+
+    Args:
+        bars: Label and execution time in seconds of each bar, top to bottom.
+
+    Returns:
+        The SVG markup of the bar chart.
+    """
+    label_width, bar_width, bar_height, bar_gap = 300, 500, 20, 6
+    max_value = max((value for _, value in bars), default=0.0) or 1.0
+    elements = []
+    for index, (label, value) in enumerate(bars):
+        y = index * (bar_height + bar_gap)
+        width = value / max_value * bar_width
+        text_y = y + bar_height * 0.75
+        elements.append(
+            f'<text x="{label_width - 6}" y="{text_y}" text-anchor="end">'
+            f"{escape(label)}</text>"
+            f'<rect x="{label_width}" y="{y}" width="{width:.1f}"'
+            f' height="{bar_height}" fill="green"/>'
+            f'<text x="{label_width + width + 6:.1f}" y="{text_y}">{value:.2f}</text>'
+        )
+    width = label_width + bar_width + 80
+    height = len(bars) * (bar_height + bar_gap) + 20
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}"'
+        ' font-family="sans-serif" font-size="12">'
+        f'{"".join(elements)}'
+        f'<text x="{label_width}" y="{height - 4}">Execution Time (seconds)</text>'
+        "</svg>"
+    )
 
-from qa_analytics_insights.data_classes import TestCase, TestClass, TestSuite
 
-# Don't use GUI backend for matplotlib to avoid errors when running on a server.
-matplotlib.use('Agg')
+_TestCaseRow = Tuple[str, str, Optional[str]]
 
 
 class ResultVisualizer:
@@ -39,7 +141,9 @@ class ResultVisualizer:
         self.test_suites = test_suites
         self._test_classes = []  # type: List[TestClass]
         self._test_cases = []  # type: List[TestCase]
-        self.plot = plt
+        self._failed_rows = None  # type: Optional[List[_TestCaseRow]]
+        self._skipped_rows = None  # type: Optional[List[_TestCaseRow]]
+        self._pie_charts_base64 = None  # type: Optional[str]
 
     @property
     def test_classes(self) -> List[TestClass]:
@@ -52,8 +156,11 @@ class ResultVisualizer:
             if not self.test_suites or self.test_suites is None:
                 logger.warning("No test suites found.")
                 return []
-            for test_suite in self.test_suites:
-                self._test_classes.extend(test_suite.test_classes)
+            self._test_classes = list(
+                chain.from_iterable(
+                    test_suite.test_classes for test_suite in self.test_suites
+                )
+            )
         return self._test_classes
 
     @property
@@ -67,13 +174,19 @@ class ResultVisualizer:
             if not self.test_suites or self.test_suites is None:
                 logger.warning("No test suites found.")
                 return []
-            for test_suite in self.test_suites:
-                self._test_cases.extend(test_suite.test_cases)
-            for test_class in self.test_classes:
-                self._test_cases.extend(test_class.test_cases)
+            self._test_cases = list(
+                chain(
+                    chain.from_iterable(
+                        test_suite.test_cases for test_suite in self.test_suites
+                    ),
+                    chain.from_iterable(
+                        test_class.test_cases for test_class in self.test_classes
+                    ),
+                )
+            )
         return self._test_cases
 
-    def plot_pie_charts_test_classes(self) -> Optional[plt.Figure]:
+    def plot_pie_charts_test_classes(self) -> Optional[Figure]:
         """Plot pie charts for each test class.
 
         Returns:
@@ -93,202 +206,131 @@ class ResultVisualizer:
         pix_size_x = max(min_size_x, num_test_classes * 2)
         pix_size_y = max(min_size_y, num_test_classes / 2)
 
-        pie_charts, axs = self.plot.subplots(
-            num_rows, num_cols, figsize=(pix_size_x, pix_size_y), clear=True
-        )
-
-        # Check if axs is an array and flatten it
-        if isinstance(axs, np.ndarray):
-            axs = axs.flatten()
-        elif isinstance(axs, plt.Axes):
-            axs = np.array([axs])
-
-        for ax, test_class in zip(axs, self.test_classes):
-            statuses = {"skipped": 0, "failed": 0, "passed": 0, "error": 0}
-            colors = {
-                "skipped": "gray",
-                "failed": "red",
-                "passed": "green",
-                "error": "orange",
-            }
-            for test_case in test_class.test_cases:
-                statuses[test_case.result] += 1
-            labels = list(statuses.keys())
-            sizes = [statuses[key] for key in labels]
+        pie_charts = Figure(figsize=(pix_size_x, pix_size_y))
+
+        # Only add the axes that are used instead of deleting the unused ones
+        for index, test_class in enumerate(self.test_classes, start=1):
+            ax = pie_charts.add_subplot(num_rows, num_cols, index)
+            # The test class counted its results when it was created
+            sizes = [
+                test_class.skipped,
+                test_class.failed,
+                test_class.passed,
+                test_class.errors,
+            ]
             labels_with_counts = [
-                f"{label} ({count})" for label, count in zip(labels, sizes)
+                f"{label} ({count})" for label, count in zip(_PIE_LABELS, sizes)
             ]
             ax.pie(
                 sizes,
                 autopct='%1.1f%%',
                 startangle=180,
-                colors=[colors[key] for key in labels],
+                colors=_PIE_COLORS,
                 textprops={'fontsize': 6},
             )
             ax.axis('equal')
             ax.set_title(f"{test_class.name}")
             ax.legend(labels_with_counts, loc='upper right', fontsize=6)
 
-        # Remove unused subplots
-        for i in range(num_test_classes, num_rows * num_cols):
-            pie_charts.delaxes(axs[i])
-
         return pie_charts
 
-    def plot_failed_test_cases_table(self) -> Optional[plt.Figure]:
-        """Plot a table of failed/error test cases.
-
-        returns:
-            The figure for failed/error test cases table.
-        """
-        logger.info("Creating failed/error test cases table.")
-        all_failed_tests = []
-
-        if self.test_cases:
-            for testcase in self.test_cases:
-                if testcase.result == "failed" or testcase.result == "error":
-                    all_failed_tests.append(
-                        (
-                            testcase.test_class or "N/A",
-                            testcase.name,
-                            testcase.failure_reason or testcase.error_reason,
-                        )
+    def _collect_test_case_rows(self) -> None:
+        """Split the test cases into failed and skipped table rows in one pass."""
+        failed_rows = []  # type: List[_TestCaseRow]
+        skipped_rows = []  # type: List[_TestCaseRow]
+        for test_case in self.test_cases:
+            result = test_case.result
+            if result == FAILED or result == ERROR:
+                failed_rows.append(
+                    (
+                        test_case.test_class or "N/A",
+                        test_case.name,
+                        test_case.failure_reason or test_case.error_reason,
                     )
-
-        if not all_failed_tests:
-            logger.warning("No failed test cases found.")
-            return None
-
-        lenght_failed_tests = len(all_failed_tests)
-        pixels_per_row = lenght_failed_tests * 2
-        pixels_per_column = lenght_failed_tests / 4
-
-        failed_test_cases_table, axes = self.plot.subplots(
-            figsize=(pixels_per_row, pixels_per_column)
-        )
-        axes.axis('tight')
-        axes.axis('off')
-        columns = ("Test Class", "Test Name", "Failure Reason")
-        table = axes.table(
-            cellText=all_failed_tests,
-            colLabels=columns,
-            cellLoc='left',
-            loc='left',
-            colColours=['#DDEBF7'] * len(columns),
-        )
-        table.auto_set_font_size(False)
-        table.set_fontsize(8)
-
-        # Loop over cells to adjust the cell borders and wrap text for better formatting
-        for _, cell in table.get_celld().items():
-            cell.set_edgecolor("black")
-            cell.set_linewidth(0.5)
-            text = cell.get_text().get_text()
-            cell.set_text_props(wrap=True)
-            cell._text.set_text(text)
-
-        # Adjust layout to make sure everything fits
-        table.auto_set_column_width(col=list(range(len(columns))))
-        table.scale(1.5, 1.5)  # Increase the size of cells to fit text
-
-        return failed_test_cases_table
-
-    def plot_skipped_test_cases_table(self) -> Optional[plt.Figure]:
-        """Plot a table of skipped test cases.
-
-        returns:
-            The figure for skipped test cases table.
-        """
-        logger.info("Creating skipped test cases table.")
-        all_skipped_tests = []
-
-        if self.test_cases:
-            for test_case in self.test_cases:
-                if test_case.result == "skipped":
-                    all_skipped_tests.append(
-                        (
-                            test_case.test_class or "N/A",
-                            test_case.name,
-                            test_case.skipped_reason,
-                        )
+                )
+            elif result == SKIPPED:
+                skipped_rows.append(
+                    (
+                        test_case.test_class or "N/A",
+                        test_case.name,
+                        test_case.skipped_reason,
                     )
+                )
+        self._failed_rows = failed_rows
+        self._skipped_rows = skipped_rows
 
-        if not all_skipped_tests:
-            logger.warning("No skipped test cases found.")
-            return None
-
-        lenght_skipped_tests = len(all_skipped_tests)
-        pixels_per_row = lenght_skipped_tests * 2
-        pixels_per_column = lenght_skipped_tests / 4
-
-        skipped_test_cases_table, axes = self.plot.subplots(
-            figsize=(pixels_per_row, pixels_per_column)
-        )
-        axes.axis('tight')
-        axes.axis('off')
-        columns = ("Test Class", "Test Name", "Skipped Reason")
-        table = axes.table(
-            cellText=all_skipped_tests,
-            colLabels=columns,
-            cellLoc='left',
-            loc='left',
-            colColours=['#DDEBF7'] * len(columns),
-        )
-        table.auto_set_font_size(False)
-        table.set_fontsize(8)
-
-        # Loop over cells to adjust the cell borders and wrap text for better formatting
-        for _, cell in table.get_celld().items():
-            cell.set_edgecolor("black")
-            cell.set_linewidth(0.5)
-            text = cell.get_text().get_text()
-            cell.set_text_props(wrap=True)
-            cell._text.set_text(text)
-
-        # Adjust layout to make sure everything fits
-        table.auto_set_column_width(col=list(range(len(columns))))
-        table.scale(1.5, 1.5)  # Increase the size of cells to fit text
-
-        return skipped_test_cases_table
+    def failed_test_cases_rows(self) -> List[_TestCaseRow]:
+        """Return the rows of the failed/error test cases table.
 
-    def plot_top_slowest_test_classes_pie_bar_chart(
-        self, slowest_test_classes: Optional[List[TestClass]] = None
-    ) -> Optional[plt.Figure]:
-        """Plot a pie bar chart of the top slowest test classes.
+        Returns:
+            Test class, name and failure reason of the failed test cases.
+        """
+        if self._failed_rows is None:
+            self._collect_test_case_rows()
+        return self._failed_rows or []
 
-        Args:
-            slowest_test_classes: List of the slowest test classes.
+    def skipped_test_cases_rows(self) -> List[_TestCaseRow]:
+        """Return the rows of the skipped test cases table.
 
         Returns:
-            The figure for the top slowest test classes pie bar chart.
+            Test class, name and skipped reason of the skipped test cases.
         """
-        logger.info("Creating top slowest test classes pie bar chart.")
-        if not slowest_test_classes or slowest_test_classes is None:
-            logger.warning("No slowest test classes found.")
-            return None
-
-        labels = [test_class.name for test_class in slowest_test_classes]
-        sizes = [test_class.execution_time for test_class in slowest_test_classes]
+        if self._skipped_rows is None:
+            self._collect_test_case_rows()
+        return self._skipped_rows or []
 
-        min_height = 5  # Set a minimum figure height
-        fig_height = max(min_height, len(labels))
+    def test_suites_summary_rows(self) -> List[Tuple[Any, ...]]:
+        """Return the rows of the test suites summary table.
 
-        top_slowest_test_classes_pie_bar_chart, axes = self.plot.subplots(
-            figsize=(20, fig_height), clear=True
+        Returns:
+            A row per test suite followed by the total and failure rate rows.
+        """
+        test_suites_summary = []  # type: List[Tuple[Any, ...]]
+        if not self.test_suites:
+            return test_suites_summary
+        tests = passed = failures = skipped = errors = 0
+        execution_time = 0.0
+        for test_suite in self.test_suites:
+            test_suites_summary.append(
+                (
+                    test_suite.name,
+                    test_suite.tests,
+                    test_suite.passed,
+                    test_suite.failures,
+                    test_suite.skipped,
+                    test_suite.errors,
+                    test_suite.execution_time,
+                )
+            )
+            tests += test_suite.tests
+            passed += test_suite.passed
+            failures += test_suite.failures
+            skipped += test_suite.skipped
+            errors += test_suite.errors
+            execution_time += test_suite.execution_time
+        test_suites_summary.append(
+            ("Total", tests, passed, failures, skipped, errors, execution_time)
         )
-
-        # You can add variety to the color if you want
-        colors = ['green' for _ in labels]
-
-        axes.bar(labels, sizes, color=colors)
-        axes.set_ylabel("Execution Time (seconds)", fontsize=12)
-        axes.set_xlabel("Test Class", fontsize=12)
-
-        return top_slowest_test_classes_pie_bar_chart
+        failure_rate = round((failures + errors) / tests * 100, 2)
+        test_suites_summary.append(
+            (
+                "Failure rate",
+                f"{failure_rate}%",
+                "",
+                "",
+                "",
+                "",
+                "",
+            )
+        )
+        return test_suites_summary
 
     @staticmethod
-    def figure_to_base64(figure: plt.Figure) -> str:
-        """Convert a Matplotlib figure to a base64 string.
+    def figure_to_base64(figure: Figure) -> str:
+        """Convert a Matplotlib figure to a base64 encoded PNG string.
+
+        The figure is drawn once by the Agg backend, the layout is tightened
+        before drawing instead of drawing twice for a tight bounding box.
 
         Args:
             figure: The figure to convert.
@@ -296,10 +338,12 @@ class ResultVisualizer:
         Returns:
             The base64 encoded string representation of the figure.
         """
-        img = BytesIO()
-        figure.savefig(img, format="svg", bbox_inches="tight")
-        img.seek(0)
-        return base64.b64encode(img.read()).decode()
+        img = _png_buffer()
+        figure.tight_layout()
+        figure.savefig(img, format="png")
+        # Encode the buffer in place, the view is released before the next reuse
+        with img.getbuffer() as png:
+            return base64.b64encode(png).decode("ascii")
 
     def build_subplots_pie_chart_test_classes_results(self) -> Optional[str]:
         """Plot the results of the parsed TestClass objects.
@@ -307,171 +351,72 @@ class ResultVisualizer:
         Returns:
             The base64 encoded string representation of the figure.
         """
+        if self._pie_charts_base64 is not None:
+            return self._pie_charts_base64
         # Create the pie chart figure
         pie_charts = self.plot_pie_charts_test_classes()
         if pie_charts is None:
             logger.debug("No test classes found.")
             return None
-        return self.figure_to_base64(pie_charts)
-
-    def build_subplots_failed_table(self) -> Optional[str]:
-        """Plot a table of failed test cases.
-
-        Returns:
-            The base64 encoded string representation of the figure.
-        """
-        failed_test_cases_table = self.plot_failed_test_cases_table()
-        if failed_test_cases_table is None:
-            logger.debug("No failed test cases found.")
-            return None
-        return self.figure_to_base64(failed_test_cases_table)
-
-    def build_subplots_skipped_table(self) -> Optional[str]:
-        """Plot a table of skipped test cases.
+        self._pie_charts_base64 = self.figure_to_base64(pie_charts)
+        return self._pie_charts_base64
 
-        Returns:
-            The base64 encoded string representation of the figure.
-        """
-        skipped_test_cases_table = self.plot_skipped_test_cases_table()
-        if skipped_test_cases_table is None:
-            logger.debug("No skipped test cases found.")
-            return None
-        return self.figure_to_base64(skipped_test_cases_table)
-
-    def build_subplots_top_slowest_test_classes(
-        self, slowest_test_classes: List[TestClass]
+    def build_top_slowest_test_classes_svg(
+        self, slowest_test_classes: Optional[List[TestClass]] = None
     ) -> Optional[str]:
-        """Plot a pie bar chart of the top slowest test classes.
+        """Build an inline SVG bar chart of the top slowest test classes.
 
         Args:
             slowest_test_classes: List of the slowest test classes.
 
         Returns:
-            The base64 encoded string representation of the figure.
+            The SVG markup or None if no slowest test classes are given.
         """
-        slowest_tests_bar_chart = self.plot_top_slowest_test_classes_pie_bar_chart(
-            slowest_test_classes
-        )
-        if slowest_tests_bar_chart is None:
+        if not slowest_test_classes:
             logger.debug("No slowest test classes found.")
             return None
-        return self.figure_to_base64(slowest_tests_bar_chart)
+        return svg_bar_chart(
+            [
+                (test_class.name, test_class.execution_time)
+                for test_class in slowest_test_classes
+            ]
+        )
 
-    def plot_test_suites_summary_table(self) -> Optional[plt.Figure]:
-        """Plot a table of test suites summary.
+    def build_failed_table_html(self) -> Optional[str]:
+        """Build an HTML table of failed/error test cases.
 
         Returns:
-            The figure for test suites summary table.
+            The HTML table or None if no test case failed.
         """
-        logger.info("Creating test suites summary table.")
-        test_suites_summary = []
-        if self.test_suites:
-            for test_suite in self.test_suites:
-                test_suites_summary.append(
-                    (
-                        test_suite.name,
-                        test_suite.tests,
-                        test_suite.passed,
-                        test_suite.failures,
-                        test_suite.skipped,
-                        test_suite.errors,
-                        test_suite.execution_time,
-                    )
-                )
-            test_suites_summary.append(
-                (
-                    "Total",
-                    sum([test_suite.tests for test_suite in self.test_suites]),
-                    sum([test_suite.passed for test_suite in self.test_suites]),
-                    sum([test_suite.failures for test_suite in self.test_suites]),
-                    sum([test_suite.skipped for test_suite in self.test_suites]),
-                    sum([test_suite.errors for test_suite in self.test_suites]),
-                    sum([test_suite.execution_time for test_suite in self.test_suites]),
-                )
-            )
-            failure_rate = round(
-                sum(
-                    [
-                        test_suite.failures + test_suite.errors
-                        for test_suite in self.test_suites
-                    ]
-                )
-                / sum([test_suite.tests for test_suite in self.test_suites])
-                * 100,
-                2,
-            )
-            test_suites_summary.append(
-                (  # type: ignore
-                    "Failure rate",
-                    f"{failure_rate}%",
-                    "",
-                    "",
-                    "",
-                    "",
-                    "",
-                )
-            )
-
-        if not test_suites_summary:
-            logger.warning("No test suites found.")
+        all_failed_tests = self.failed_test_cases_rows()
+        if not all_failed_tests:
+            logger.debug("No failed test cases found.")
             return None
+        return html_table(_FAILED_TABLE_COLUMNS, all_failed_tests)
 
-        lenght_test_suites_summary = len(test_suites_summary)
+    def build_skipped_table_html(self) -> Optional[str]:
+        """Build an HTML table of skipped test cases.
 
-        # Set a minimum size for the bar chart
-        min_size_x, min_size_y = 1, 1
-        pixels_per_row = max(min_size_x, lenght_test_suites_summary * 2)
-        pixels_per_column = max(min_size_y, lenght_test_suites_summary / 2)
-
-        test_suites_summary_table, axes = self.plot.subplots(
-            figsize=(pixels_per_row, pixels_per_column)
-        )
-        axes.axis('tight')
-        axes.axis('off')
-        columns = (
-            "Test Suite",
-            "Total",
-            "Passed",
-            "Failed",
-            "Skipped",
-            "Errors",
-            "Time",
-        )
-        table = axes.table(
-            cellText=test_suites_summary,
-            colLabels=columns,
-            cellLoc='left',
-            loc='left',
-            colColours=['#DDEBF7'] * len(columns),
-        )
-        table.auto_set_font_size(False)
-        table.set_fontsize(8)
-
-        # Loop over cells to adjust the cell borders and wrap text for better formatting
-        for _, cell in table.get_celld().items():
-            cell.set_edgecolor("black")
-            cell.set_linewidth(0.5)
-            text = cell.get_text().get_text()
-            cell.set_text_props(wrap=True)
-            cell._text.set_text(text)
-
-        # Adjust layout to make sure everything fits
-        table.auto_set_column_width(col=list(range(len(columns))))
-        table.scale(1.5, 1.5)
-
-        return test_suites_summary_table
+        Returns:
+            The HTML table or None if no test case was skipped.
+        """
+        all_skipped_tests = self.skipped_test_cases_rows()
+        if not all_skipped_tests:
+            logger.debug("No skipped test cases found.")
+            return None
+        return html_table(_SKIPPED_TABLE_COLUMNS, all_skipped_tests)
 
-    def build_subplots_test_suites_summary_table(self) -> Optional[str]:
-        """Plot a table of test suites summary.
+    def build_test_suites_summary_table_html(self) -> Optional[str]:
+        """Build an HTML table of test suites summary.
 
         Returns:
-            The base64 encoded string representation of the figure.
+            The HTML table or None if no test suites are found.
         """
-        test_suites_summary_table = self.plot_test_suites_summary_table()
-        if test_suites_summary_table is None:
+        test_suites_summary = self.test_suites_summary_rows()
+        if not test_suites_summary:
             logger.debug("No test suites found.")
             return None
-        return self.figure_to_base64(test_suites_summary_table)
+        return html_table(_SUMMARY_TABLE_COLUMNS, test_suites_summary)
 
     @staticmethod
     def generate_html_report_to_file(
@@ -484,97 +429,100 @@ class ResultVisualizer:
     ) -> None:
         """Generate an HTML report of the test results.
 
+        The pie charts are embedded as a base64 image, the bar chart as an
+        inline SVG and the tables as HTML tables.
+
         Args:
             pie_charts: Base64 string representing the pie charts.
-            failed_table: Base64 string representing the failed test cases table.
-            skipped_table: Base64 string representing the skipped test cases table.
-            summary_table: Base64 string representing the test suites summary table.
-            slowest_classes: Base64 string representing the top slowest test classes.
+            failed_table: HTML table of the failed test cases.
+            skipped_table: HTML table of the skipped test cases.
+            summary_table: HTML table of the test suites summary.
+            slowest_classes: Inline SVG bar chart of the top slowest test classes.
             output: Output file name.
         """
         logger.info("Generating HTML report...")
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Test Results Visualization</title>
-        </head>
-        <body>
-            <h1>Generated Test Result({timestamp})</h1>
-            <h2>Test Suites Summary</h2>
-            <img
-                src="data:image/svg+xml;base64,{summary_table}"
-                alt="Test Suites Summary Table">
-            <h2>Test Results Pie Charts Based on Test Classes</h2>
-            <img
-                src="data:image/svg+xml;base64,{pie_charts}"
-                alt="Test Results Pie Charts">
-            <h2>Failed Test Cases</h2>
-            <img
-                src="data:image/svg+xml;base64,{failed_table}"
-                alt="Failed Test Cases Table">
-            <h2>Top Slowest Test Classes</h2>
-            <img
-                src="data:image/svg+xml;base64,{slowest_classes}"
-                alt="Top Slowest Test Classes Pie Bar Chart">
-            <h2>Skipped Test Cases</h2>
-            <img src="data:image/svg+xml;base64,{skipped_table}"
-                alt="Skipped Test Cases Table">
-        </body>
-        </html>
-        """
+        tables = (
+            ("Failed Test Cases", failed_table),
+            ("Top Slowest Test Classes", slowest_classes),
+            ("Skipped Test Cases", skipped_table),
+        )
 
-        # Save the HTML content to a file
+        # Stream the sections so the report is never held in memory as a whole
         html_file_path = f"{output}.html"
         with open(html_file_path, "w") as f:
-            f.write(html_content)
+            f.write(
+                "<!DOCTYPE html>\n<html>\n<head>\n"
+                "<title>Test Results Visualization</title>\n</head>\n<body>\n"
+                f"<h1>Generated Test Result({timestamp})</h1>\n"
+                "<h2>Test Suites Summary</h2>\n"
+            )
+            f.write(summary_table or "")
+            f.write("\n<h2>Test Results Pie Charts Based on Test Classes</h2>\n")
+            if pie_charts:
+                f.write('<img src="data:image/png;base64,')
+                f.write(pie_charts)
+                f.write('" alt="Test Results Pie Charts">\n')
+            for title, content in tables:
+                f.write(f"<h2>{title}</h2>\n")
+                f.write(content or "")
+                f.write("\n")
+            f.write("</body>\n</html>\n")
         logger.info(f"HTML report saved to: {Path(html_file_path).absolute()}")
 
     def run(
         self,
         output: str = "test_results_visualization",
-        pie_charts: Optional[plt.Figure] = None,
-        failed_table: Optional[plt.Figure] = None,
-        skipped_table: Optional[plt.Figure] = None,
-        summary_table: Optional[plt.Figure] = None,
+        pie_charts: bool = False,
+        failed_table: bool = False,
+        skipped_table: bool = False,
+        summary_table: bool = False,
         slowest_classes: Optional[List[TestClass]] = None,
     ) -> None:
         """Main execution method.
 
         Args:
             output: Output file name.
-            pie_charts: Figure containing the pie charts.
-            failed_table: Figure containing the failed test cases table.
-            skipped_table: Figure containing the skipped test cases table.
+            pie_charts: Include the pie charts of the test classes.
+            failed_table: Include the failed test cases table.
+            skipped_table: Include the skipped test cases table.
             slowest_classes: List of the slowest test classes.
-            summary_table: Figure containing the test suites summary table.
+            summary_table: Include the test suites summary table.
         """
+        pie_charts_base64 = None  # type: Optional[str]
+        failed_table_html = None  # type: Optional[str]
+        skipped_table_html = None  # type: Optional[str]
+        summary_table_html = None  # type: Optional[str]
+        slowest_classes_svg = None  # type: Optional[str]
         if pie_charts:
-            pie_charts = self.build_subplots_pie_chart_test_classes_results()
+            pie_charts_base64 = self.build_subplots_pie_chart_test_classes_results()
         if failed_table:
-            failed_table = self.build_subplots_failed_table()
+            failed_table_html = self.build_failed_table_html()
         if skipped_table:
-            skipped_table = self.build_subplots_skipped_table()
+            skipped_table_html = self.build_skipped_table_html()
         if summary_table:
-            summary_table = self.build_subplots_test_suites_summary_table()
+            summary_table_html = self.build_test_suites_summary_table_html()
         if slowest_classes:
-            slowest_test_classes = self.build_subplots_top_slowest_test_classes(
+            slowest_classes_svg = self.build_top_slowest_test_classes_svg(
                 slowest_classes
             )
 
         self.generate_html_report_to_file(
             output,
-            pie_charts,
-            failed_table,
-            skipped_table,
-            summary_table,
-            slowest_test_classes,
+            pie_charts_base64,
+            failed_table_html,
+            skipped_table_html,
+            summary_table_html,
+            slowest_classes_svg,
         )
 
 
 class ParallelResultVisualizer(ResultVisualizer):
-    """Class to visualize the results of the parsed TestClass objects in parallel."""
+    """Class to generate the whole HTML report of the parsed TestClass objects.
+
+    Despite its name the report is built sequentially, the pie charts are
+    the only rendered figure and the rest of the report is plain markup.
+    """
 
     def __init__(
         self,
@@ -598,35 +546,20 @@ class ParallelResultVisualizer(ResultVisualizer):
             output: Output file name.
             slowest_test_classes: List of the slowest test classes.
         """
-        slowest_classes_base64 = None
-        # Use ThreadPoolExecutor to run plot generation in parallel
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            pie_chart_future = executor.submit(
-                self.build_subplots_pie_chart_test_classes_results
-            )
-            failed_table_future = executor.submit(self.build_subplots_failed_table)
-            skipped_table_future = executor.submit(self.build_subplots_skipped_table)
-            summary_table_future = executor.submit(
-                self.build_subplots_test_suites_summary_table
-            )
-            if slowest_test_classes and slowest_test_classes is not None:
-                slowest_classes_future = executor.submit(
-                    self.build_subplots_top_slowest_test_classes, slowest_test_classes
-                )
-                slowest_classes_base64 = slowest_classes_future.result()
-
-            # Wait for all futures to complete and retrieve results
-            pie_chart_base64 = pie_chart_future.result()
-            failed_table_base64 = failed_table_future.result()
-            skipped_table_base64 = skipped_table_future.result()
-            summary_table_base64 = summary_table_future.result()
+        pie_chart_base64 = self.build_subplots_pie_chart_test_classes_results()
+        failed_table_html = self.build_failed_table_html()
+        skipped_table_html = self.build_skipped_table_html()
+        summary_table_html = self.build_test_suites_summary_table_html()
+        slowest_classes_svg = self.build_top_slowest_test_classes_svg(
+            slowest_test_classes
+        )
 
         # Generate the HTML report with the results
         self.generate_html_report_to_file(
             output,
             pie_chart_base64,
-            failed_table_base64,
-            skipped_table_base64,
-            summary_table_base64,
-            slowest_classes_base64,
+            failed_table_html,
+            skipped_table_html,
+            summary_table_html,
+            slowest_classes_svg,
         )
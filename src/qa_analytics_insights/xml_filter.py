@@ -5,18 +5,66 @@ This module filters XML files from the given path queue.
 
 from pathlib import Path
 from queue import Queue
+from typing import Iterable, List, Optional, Union  # noqa: F401
+from xml.etree import ElementTree as ET
 
 from loguru import logger
 
+# Bytes read from the start of an XML file to tell whether it is a JUnit report.
+_HEADER_SIZE = 4096
+
+# Root tags of a JUnit XML report.
+_JUNIT_ROOT_TAGS = ("testsuites", "testsuite", "testcase")
+
+
+def _root_tag(path: Path) -> Optional[str]:
+    """Returns the root tag of an XML file, parsing no further than its start.
+
+    Args:
+        path: Path to the XML file.
+
+    Returns:
+        The root tag or None if the file cannot be parsed.
+    """
+    try:
+        with open(path, "rb") as xml_file:
+            _, root = next(ET.iterparse(xml_file, events=("start",)))
+    except (OSError, ET.ParseError, StopIteration):
+        return None
+    return str(root.tag)
+
+
+def is_junit_xml(path: Path) -> bool:
+    """Tells whether the file looks like a JUnit XML report from its header.
+
+    The start of the file is searched for a testsuites, testsuite or
+    testcase tag first. When it has none, for example in a UTF-16 file or
+    after a long prolog, the root tag is parsed instead.
+
+    Args:
+        path: Path to the XML file.
+
+    Returns:
+        True if the file looks like a JUnit XML report.
+    """
+    try:
+        with open(path, "rb") as xml_file:
+            header = xml_file.read(_HEADER_SIZE)
+    except OSError:
+        return False
+    if b"<testsuite" in header or b"<testcase" in header:
+        return True
+    return _root_tag(path) in _JUNIT_ROOT_TAGS
+
 
 class XMLFilter:
     """Responsible for filtering XML files from the given path queue."""
 
-    def __init__(self, path_queue: Queue[Path]) -> None:
+    def __init__(self, path_queue: Union[Queue[Path], Iterable[Path]]) -> None:
         """Responsible for filtering XML files from the given path queue.
 
         Args:
-            path_queue: Queue of paths to filter XML files from.
+            path_queue: Queue or iterable of paths to filter XML files from.
         """
         self.path_queue = path_queue
         self.xml_queue = Queue()  # type: Queue[Path]
@@ -27,13 +75,38 @@ class XMLFilter:
         Returns:
             Queue of XML files.
         """
-        try:
-            while not self.path_queue.empty():
-                path = self.path_queue.get()
-                if path.suffix == ".xml":
-                    self.xml_queue.put(path)
-                else:
-                    logger.debug(f"Skipped non-XML file: {path}")
-        except Exception as unknown_error:  # pragma: no cover
-            logger.exception(f"Error filtering XML files: {unknown_error}")
+        for path in self.filter_xml_list():
+            self.xml_queue.put(path)
         return self.xml_queue
+
+    def filter_xml_list(self) -> List[Path]:
+        """Filters XML files from the given paths in a single pass.
+
+        XML files that do not look like JUnit XML reports are skipped
+        without being parsed.
+
+        Returns:
+            List of XML files.
+        """
+        xml_paths = []  # type: List[Path]
+        for path in self._paths():
+            if path.suffix != ".xml":
+                logger.debug(f"Skipped non-XML file: {path}")
+                continue
+            if is_junit_xml(path):
+                xml_paths.append(path)
+            else:
+                logger.debug(f"Skipped non-JUnit XML file: {path}")
+        return xml_paths
+
+    def _paths(self) -> Iterable[Path]:
+        """Yields the paths to filter.
+
+        Yields:
+            Paths from the given queue or iterable.
+        """
+        if not isinstance(self.path_queue, Queue):
+            yield from self.path_queue
+            return
+        while not self.path_queue.empty():
+            yield self.path_queue.get()
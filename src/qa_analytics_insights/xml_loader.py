@@ -3,9 +3,12 @@
 This module is responsible for loading XML files.
 """
 
-from typing import Optional  # noqa F401
+from typing import Iterator, List, Optional  # noqa F401
 from xml.etree import ElementTree as ET
 
+# Size of the read buffer of the XML files, large enough to need few reads.
+_READ_BUFFER_SIZE = 1 << 16
+
 
 class XMLLoader:
     """Responsible for loading XML file."""
@@ -19,6 +22,7 @@ class XMLLoader:
         self.xml_path = xml_path
         self._tree = None  # type: Optional[ET.ElementTree]
         self._root = None  # type: Optional[ET.Element]
+        self._suite = None  # type: Optional[ET.Element]
 
     @property
     def tree(self) -> ET.ElementTree:  # pragma: no cover
@@ -27,8 +31,9 @@ class XMLLoader:
         Returns:
             XML tree.
         """
-        if not self._tree:
-            self._tree = ET.parse(self.xml_path)
+        if self._tree is None:
+            with open(self.xml_path, "rb", buffering=_READ_BUFFER_SIZE) as xml_file:
+                self._tree = ET.parse(xml_file)
         return self._tree
 
     @property
@@ -38,6 +43,55 @@ class XMLLoader:
         Returns:
             XML root.
         """
-        if not self._root:
+        if self._root is None:
             self._root = self.tree.getroot()
         return self._root
+
+    @property
+    def suite(self) -> Optional[ET.Element]:
+        """Returns the suite element found by iter_testcases.
+
+        This is the first testsuite element under the root element, or
+        the root element itself if there is none. It is None until the
+        testcases have been streamed.
+
+        Returns:
+            Suite element.
+        """
+        return self._suite
+
+    def iter_testcases(self) -> Iterator[ET.Element]:
+        """Streams the testcase elements without building the whole XML tree.
+
+        Each testcase element is detached from its parent and cleared once
+        the next one is requested, so only one testcase is kept in memory.
+
+        Yields:
+            Testcase elements.
+        """
+        root = None  # type: Optional[ET.Element]
+        suite = None  # type: Optional[ET.Element]
+        parents = []  # type: List[ET.Element]
+        with open(self.xml_path, "rb", buffering=_READ_BUFFER_SIZE) as xml_file:
+            for event, element in ET.iterparse(xml_file, events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = element
+                        # A testsuite root is the suite, no need to look further
+                        if element.tag == "testsuite":
+                            suite = element
+                    elif (
+                        suite is None
+                        and element.tag == "testsuite"
+                        and len(parents) == 1
+                    ):
+                        suite = element
+                    parents.append(element)
+                    continue
+                parents.pop()
+                if element.tag == "testcase":
+                    yield element
+                    if parents:
+                        parents[-1].remove(element)
+                    element.clear()
+        self._suite = suite if suite is not None else root
@@ -3,17 +3,32 @@
 This module is responsible for parsing XML files into TestSuite objects.
 """
 
+import warnings
 from collections import defaultdict
 from typing import List  # noqa: F401
-from xml.etree import ElementTree as ET  # noqa: F401
+from xml.etree import ElementTree as ET
 
 from loguru import logger
 
 from qa_analytics_insights.data_classes import TestClass, TestSuite
-from qa_analytics_insights.parser import ParserTestCase, ParserTestSuite
+from qa_analytics_insights.parser import ParserTestSuite, parse_testcase
+from qa_analytics_insights.xml_loader import XMLLoader  # noqa: F401
 from qa_analytics_insights.xml_tag_finder import XMLTagFinder
 
 
+def _warn_deprecated(name: str) -> None:
+    """Warns that an XMLParser attribute is deprecated.
+
+    Args:
+        name: Name of the deprecated attribute.
+    """
+    warnings.warn(
+        f"XMLParser.{name} is deprecated, use XMLParser.xml_tag_finder instead.",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
 class XMLParser:
     """Responsible for parsing XML files into TestClass and TestCase objects."""
 
@@ -24,18 +39,55 @@ class XMLParser:
             xml_tag_finder: XMLTagFinder object.
         """
         self.xml_tag_finder = xml_tag_finder
-        self.root = self.xml_tag_finder.root  # type: ET.Element
-        self.xml_path = self.xml_tag_finder.xml_loader.xml_path  # type: str
-        self.test_case_tags = self.xml_tag_finder.test_cases  # type: List[ET.Element]
-        self.suite_tag = self.xml_tag_finder.suite  # type: ET.Element
-        self.suite_parser = ParserTestSuite(self.suite_tag)  # type: ParserTestSuite
+        self.xml_loader = self.xml_tag_finder.xml_loader  # type: XMLLoader
+        self.xml_path = self.xml_loader.xml_path  # type: str
+
+    @property
+    def root(self) -> ET.Element:
+        """Deprecated, returns the root element of the XML file.
+
+        Returns:
+            Root element.
+        """
+        _warn_deprecated("root")
+        return self.xml_tag_finder.root
+
+    @property
+    def test_case_tags(self) -> List[ET.Element]:
+        """Deprecated, returns all the testcase tags in the XML file.
+
+        Returns:
+            List of testcase tags.
+        """
+        _warn_deprecated("test_case_tags")
+        return self.xml_tag_finder.test_cases
+
+    @property
+    def suite_tag(self) -> ET.Element:
+        """Deprecated, returns the suite element.
+
+        Returns:
+            Suite element.
+        """
+        _warn_deprecated("suite_tag")
+        return self.xml_tag_finder.suite
+
+    @property
+    def suite_parser(self) -> ParserTestSuite:
+        """Deprecated, returns a parser of the suite element.
+
+        Returns:
+            ParserTestSuite object.
+        """
+        _warn_deprecated("suite_parser")
+        return ParserTestSuite(self.xml_tag_finder.suite)
 
     def parse(self) -> TestSuite:
         """Parses the XML file into TestClass and TestCase objects.
 
-        This method parses test cases and groups them by their class name.
-        If a test case has no class name,it will be added to the
-        ungrouped_test_cases list.
+        This method streams the test cases from the XML file and groups them
+        by their class name. If a test case has no class name,it will be added
+        to the ungrouped_test_cases list.
 
         Returns:
             TestSuite object.
@@ -44,11 +96,10 @@ class XMLParser:
         classwise_test_cases = defaultdict(list)
 
         # Creating test cases and grouping them by classname
-        for testcase in self.test_case_tags:
-            test_case_parser = ParserTestCase(testcase)
-            test_case = test_case_parser.parse()
+        for testcase in self.xml_loader.iter_testcases():
+            test_case = parse_testcase(testcase)
             if not test_case.test_class or test_case.test_class is None:
-                logger.debug(f"Test case {test_case.name} has no test class.")
+                logger.debug("Test case {} has no test class.", test_case.name)
                 ungrouped_test_cases.append(test_case)
             else:
                 classwise_test_cases[test_case.test_class].append(test_case)
@@ -59,8 +110,11 @@ class XMLParser:
             for classname, test_cases in classwise_test_cases.items()
         ]
 
-        # Creating TestSuite object
-        test_suite = self.suite_parser.parse()
+        # Creating TestSuite object from the suite element found while streaming
+        suite_tag = self.xml_loader.suite
+        if suite_tag is None:  # pragma: no cover
+            raise ET.ParseError(f"No root element found in {self.xml_path}")
+        test_suite = ParserTestSuite(suite_tag).parse()
         test_suite.test_classes = test_classes
         test_suite.test_cases = ungrouped_test_cases
 
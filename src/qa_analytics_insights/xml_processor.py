@@ -1,20 +1,99 @@
 """Copyright (c) 2023, Aydin Abdi.
 
 This module processes files in the given path in parallel and
-puts the xml files in a queue for further processing.
+parses the xml files into test suites.
 """
 
-import threading
-from queue import Queue
-from typing import List  # noqa: F401
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from typing import List, Optional, Sequence, Union  # noqa: F401
 
-from qa_analytics_insights.data_classes import TestSuite  # noqa: F401
+from loguru import logger
+
+from qa_analytics_insights.data_classes import TestSuite
 from qa_analytics_insights.patch_fetcher import PathFetcher
 from qa_analytics_insights.xml_filter import XMLFilter
 from qa_analytics_insights.xml_loader import XMLLoader
 from qa_analytics_insights.xml_parser import XMLParser
 from qa_analytics_insights.xml_tag_finder import XMLTagFinder
 
+# Number of batches of XML files handed to every worker process.
+_BATCHES_PER_WORKER = 4
+
+
+def parse_xml_file(xml_path: Union[str, Path]) -> TestSuite:
+    """Parses a single XML file into a TestSuite object.
+
+    This is a module level function so that it can be run in worker processes.
+
+    Args:
+        xml_path: Path to the XML file.
+
+    Returns:
+        TestSuite object.
+    """
+    xml_loader = XMLLoader(str(xml_path))
+    xml_tag_finder = XMLTagFinder(xml_loader)
+    xml_parser = XMLParser(xml_tag_finder)
+    return xml_parser.parse()
+
+
+def _file_size(path: Path) -> int:
+    """Returns the size of a file, 0 if it cannot be read.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Size of the file in bytes.
+    """
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def parse_xml_files(xml_paths: Sequence[Path]) -> List[Union[TestSuite, str]]:
+    """Parses a batch of XML files into TestSuite objects.
+
+    A file that cannot be parsed gives its error message instead, so that
+    the rest of the batch is still returned.
+
+    Args:
+        xml_paths: Paths to the XML files.
+
+    Returns:
+        TestSuite object or error message of every XML file, in order.
+    """
+    results = []  # type: List[Union[TestSuite, str]]
+    for xml_path in xml_paths:
+        try:
+            results.append(parse_xml_file(xml_path))
+        except Exception as parse_error:
+            results.append(str(parse_error))
+    return results
+
+
+def process_pool_context() -> Optional[BaseContext]:
+    """Returns the multiprocessing context for the worker processes.
+
+    The forkserver start method is used where available. Workers are forked
+    from a single-threaded server with this module already imported,
+    instead of forking the possibly multi-threaded main process or
+    importing the package again in every spawned worker.
+
+    Returns:
+        The forkserver context, or None for the platform default.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return None  # pragma: no cover
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__])
+    return context
+
 
 class XMLProcessor:
     """Responsible for processing files into xml queues.
@@ -31,40 +110,68 @@ class XMLProcessor:
         """
         self.path = path
         self.test_suites = []  # type: List[TestSuite]
-        self.lock = threading.Lock()  # type: threading.Lock
 
-    def process_files_in_parallel(self, num_threads: int) -> None:
+    def process_files_in_parallel(self, num_workers: Optional[int] = None) -> None:
         """Processes the XML files in the given path in parallel.
 
+        Several XML files are parsed in worker processes, a single XML file
+        is parsed in the calling thread.
+
         Args:
-            num_threads: Number of threads to use for processing.
+            num_workers: Maximum number of workers to use for processing.
+                Defaults to the number of CPUs.
         """
+        num_workers = num_workers or os.cpu_count() or 1
         file_fetcher = PathFetcher(self.path)
-        file_queue = file_fetcher.fetch_paths()
-        xml_filter = XMLFilter(file_queue)
-        xml_queue = xml_filter.filter_xml()
-        threads = []
+        file_paths = file_fetcher.fetch_paths()
+        xml_filter = XMLFilter(file_paths)
+        # Parse every file once, the largest first so it does not finish last
+        xml_paths = sorted(
+            dict.fromkeys(xml_filter.filter_xml_list()), key=_file_size, reverse=True
+        )
+        if len(xml_paths) > 1:
+            self._process_xml_files_in_processes(xml_paths, num_workers)
+            return
 
-        for _ in range(num_threads):
-            thread = threading.Thread(target=self._process_xml, args=(xml_queue,))
-            threads.append(thread)
-            thread.start()
+        self._process_xml(xml_paths)
 
-        for thread in threads:
-            thread.join()
+    def _process_xml_files_in_processes(
+        self, xml_paths: List[Path], num_workers: int
+    ) -> None:
+        """Parses the XML files in worker processes.
+
+        XML parsing is CPU bound and holds the GIL, so processes are used to
+        parse several files at the same time. A file that cannot be parsed
+        is logged and skipped.
+
+        Args:
+            xml_paths: Paths of the XML files to process.
+            num_workers: Maximum number of worker processes.
+        """
+        max_workers = min(len(xml_paths), num_workers)
+        # A few batches per worker amortize the task overhead. The files are
+        # dealt out in turn, so every batch gets its share of the large ones
+        num_batches = min(len(xml_paths), max_workers * _BATCHES_PER_WORKER)
+        batches = [xml_paths[index::num_batches] for index in range(num_batches)]
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=process_pool_context()
+        ) as executor:
+            futures = [executor.submit(parse_xml_files, batch) for batch in batches]
+            for batch, future in zip(batches, futures):
+                for xml_path, result in zip(batch, future.result()):
+                    if isinstance(result, TestSuite):
+                        self.test_suites.append(result)
+                    else:
+                        logger.error(f"Could not parse {xml_path}: {result}")
 
-    def _process_xml(self, xml_queue: Queue[str]) -> None:
-        """Processes the XML files in the given path.
+    def _process_xml(self, xml_paths: List[Path]) -> None:
+        """Processes the XML files in the calling thread.
 
         Args:
-            xml_queue: Queue of XML files to process.
+            xml_paths: XML files to process.
         """
-        while not xml_queue.empty():
-            xml_path = xml_queue.get()
-            xml_loader = XMLLoader(xml_path)
-            xml_tag_finder = XMLTagFinder(xml_loader)
-            xml_parser = XMLParser(xml_tag_finder)
-            test_suite = xml_parser.parse()
-
-            with self.lock:
-                self.test_suites.append(test_suite)
+        for xml_path in xml_paths:
+            try:
+                self.test_suites.append(parse_xml_file(xml_path))
+            except Exception as parse_error:
+                logger.error(f"Could not parse {xml_path}: {parse_error}")
@@ -19,19 +19,34 @@ class XMLTagFinder:
             xml_loader: XMLLoader object.
         """
         self.xml_loader = xml_loader
-        self.root = self.xml_loader.root  # type: ET.Element
-        self._test_cases = []  # type: List[ET.Element]
+        self._test_cases = None  # type: Optional[List[ET.Element]]
         self._suite = None  # type: Optional[ET.Element]
 
+    @property
+    def root(self) -> ET.Element:
+        """Returns the root element of the XML file.
+
+        Returns:
+            Root element.
+        """
+        return self.xml_loader.root
+
     @property
     def test_cases(self) -> List[ET.Element]:
         """Returns all the testcase tags in the XML file.
 
+        The testcase tags of a testsuite root without nested suites are
+        looked up as its children, any other document is searched whole.
+
         Returns:
             List of testcase tags.
         """
-        if not self._test_cases:
-            self._test_cases = self.root.findall(".//testcase")
+        if self._test_cases is None:
+            root = self.root
+            if root.tag == "testsuite" and root.find("testsuite") is None:
+                self._test_cases = root.findall("testcase")
+            else:
+                self._test_cases = list(root.iter("testcase"))
         return self._test_cases
 
     @property
@@ -45,5 +60,9 @@ class XMLTagFinder:
             Suite element.
         """
         if self._suite is None:
-            self._suite = self.root.find("testsuite") or self.root
+            root = self.root
+            # A testsuite root is the suite, only a testsuites root is searched
+            suite = None if root.tag == "testsuite" else root.find("testsuite")
+            # An element without children is falsy, compare with None instead
+            self._suite = root if suite is None else suite
         return self._suite
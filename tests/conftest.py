@@ -0,0 +1,21 @@
+"""Copyright (c) 2023, Aydin Abdi.
+
+Shared fixtures for the unit tests.
+"""
+
+import pytest
+
+from qa_analytics_insights.xml_loader import XMLLoader
+from qa_analytics_insights.xml_tag_finder import XMLTagFinder
+
+
+@pytest.fixture(scope="session")
+def xml_loader() -> XMLLoader:
+    """Returns XMLLoader object of the pytest result, its tree is parsed once."""
+    return XMLLoader("tests/data/pytest_test_result.xml")
+
+
+@pytest.fixture
+def xml_tag_finder(xml_loader: XMLLoader) -> XMLTagFinder:
+    """Returns XMLTagFinder object."""
+    return XMLTagFinder(xml_loader)
@@ -0,0 +1,62 @@
+"""Copyright (c) 2023, Aydin Abdi.
+
+Unit tests for cli.py module.
+"""
+
+import sys
+
+import pytest
+
+from qa_analytics_insights.cli import ArgsParser, Cli
+
+
+def test_args_parser_parses_arguments() -> None:
+    """Test ArgsParser parses the command line arguments."""
+    args = ArgsParser().parser.parse_args(["-f", "tests/data", "-o", "report", "-vv"])
+
+    assert args.file_path == "tests/data"
+    assert args.output == "report"
+    assert args.verbose is True
+
+
+def test_cli_does_not_parse_sys_argv_on_init(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test Cli can be created when sys.argv holds unrelated arguments."""
+    monkeypatch.setattr(sys, "argv", ["prog", "--unrelated"])
+
+    cli = Cli()
+
+    assert cli.args is None
+
+
+def test_cli_main_without_arguments_prints_usage(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test cli_main prints the usage when no arguments are given."""
+    Cli().cli_main([])
+
+    assert "usage: qa-analytics-insights" in capsys.readouterr().out
+
+
+def test_cli_main_parses_given_arguments(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test cli_main parses the given arguments once and runs the analysis."""
+    calls = []
+    monkeypatch.setattr(Cli, "run", lambda self, *args: calls.append(args))
+    cli = Cli()
+
+    cli.cli_main(["-f", "tests/data", "-o", "outputs/report"])
+
+    assert cli.args is not None
+    assert cli.args.file_path == "tests/data"
+    assert calls == [("tests/data", "outputs/report")]
+
+
+def test_args_parser_caches_parser() -> None:
+    """Test ArgsParser builds the parser once."""
+    args_parser = ArgsParser()
+
+    assert args_parser.parser is args_parser.parser
+
+
+def test_args_parser_instances_share_parser() -> None:
+    """Test the parser is built once for all ArgsParser instances."""
+    assert ArgsParser().parser is ArgsParser().parser
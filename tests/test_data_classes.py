@@ -0,0 +1,91 @@
+"""Copyright (c) 2023, Aydin Abdi.
+
+Unit tests for data_classes.py module.
+"""
+
+import pickle
+import sys
+
+import pytest
+
+from qa_analytics_insights import data_classes
+
+
+def test_test_class_metrics() -> None:
+    """Test TestClass calculates the metrics of its test cases."""
+    test_cases = [
+        data_classes.TestCase(name="test_passed", execution_time=1.0),
+        data_classes.TestCase(name="test_failed", execution_time=2.0, result="failed"),
+        data_classes.TestCase(name="test_skipped", result="skipped"),
+        data_classes.TestCase(name="test_error", execution_time=0.5, result="error"),
+        data_classes.TestCase(name="test_passed_again", execution_time=1.5),
+    ]
+    test_class = data_classes.TestClass(name="TestClass", test_cases=test_cases)
+
+    assert test_class.passed == 2
+    assert test_class.failed == 1
+    assert test_class.skipped == 1
+    assert test_class.errors == 1
+    assert test_class.execution_time == 5.0
+    assert test_class.failed_test_cases == [test_cases[1]]
+    assert test_class.skipped_test_cases == [test_cases[2]]
+    assert test_class.error_test_cases == [test_cases[3]]
+
+
+def test_test_class_metrics_with_many_test_cases() -> None:
+    """Test TestClass counts every test case of a large class."""
+    test_cases = [
+        data_classes.TestCase(name=f"test_{i}", execution_time=1.0) for i in range(5000)
+    ]
+    test_class = data_classes.TestClass(name="TestClass", test_cases=test_cases)
+
+    assert test_class.passed == 5000
+    assert test_class.execution_time == 5000.0
+
+
+def test_test_class_without_test_cases() -> None:
+    """Test TestClass without test cases."""
+    test_class = data_classes.TestClass(name="TestClass")
+
+    assert test_class.passed == 0
+    assert test_class.execution_time == 0.0
+    assert test_class.failed_test_cases == []
+
+
+def test_test_suite_passed() -> None:
+    """Test TestSuite calculates the number of passed tests."""
+    test_suite = data_classes.TestSuite(
+        name="suite", tests=10, errors=1, failures=2, skipped=3
+    )
+
+    assert test_suite.passed == 4
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slots require Python 3.10")
+def test_data_classes_use_slots() -> None:
+    """Test the data classes are created without an instance dictionary."""
+    test_case = data_classes.TestCase(name="test")
+    test_class = data_classes.TestClass(name="TestClass", test_cases=[test_case])
+    test_suite = data_classes.TestSuite(name="suite", test_classes=[test_class])
+
+    for instance in (test_case, test_class, test_suite):
+        assert not hasattr(instance, "__dict__")
+
+
+def test_data_classes_are_picklable() -> None:
+    """Test the data classes can be pickled."""
+    test_case = data_classes.TestCase(name="test", result="failed")
+    test_class = data_classes.TestClass(name="TestClass", test_cases=[test_case])
+
+    unpickled = pickle.loads(pickle.dumps(test_class))
+
+    assert unpickled == test_class
+    assert unpickled.failed_test_cases == [test_case]
+
+
+def test_test_suite_passed_follows_counts() -> None:
+    """Test TestSuite.passed is calculated from the current counts."""
+    test_suite = data_classes.TestSuite(name="suite", tests=10, failures=2)
+    test_suite.skipped = 3
+
+    assert test_suite.passed == 5
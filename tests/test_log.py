@@ -4,8 +4,13 @@ Unit tests for log.py module.
 """
 
 import time
+from pathlib import Path
+
+import pytest
+from loguru import logger
 
 from qa_analytics_insights.log import (
+    LOG_FILE_ENV,
     default_logging,
     log_execution_time,
     verbose_logging,
@@ -31,3 +36,39 @@ def test_log_execution_time() -> None:
         time.sleep(1)
 
     execution_time_func()
+
+
+def test_default_logging_without_log_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test no log file is written unless requested."""
+    monkeypatch.delenv(LOG_FILE_ENV, raising=False)
+    monkeypatch.chdir(tmp_path)
+    default_logging()
+    logger.debug("debug message")
+    logger.remove()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_default_logging_with_log_file(tmp_path: Path) -> None:
+    """Test the debug log is written to the given log file."""
+    log_file = tmp_path / "qa_analytics_insights.log"
+    default_logging(str(log_file))
+    logger.debug("debug message")
+    logger.remove()
+
+    assert "debug message" in log_file.read_text()
+
+
+def test_verbose_logging_with_log_file_env(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the log file can be set by the environment variable."""
+    log_file = tmp_path / "qa_analytics_insights.log"
+    monkeypatch.setenv(LOG_FILE_ENV, str(log_file))
+    verbose_logging()
+    logger.debug("debug message")
+    logger.remove()
+
+    assert "debug message" in log_file.read_text()
@@ -0,0 +1,225 @@
+"""Copyright (c) 2023, Aydin Abdi.
+
+Unit tests for parser.py module.
+"""
+
+from typing import Optional
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from qa_analytics_insights import data_classes
+from qa_analytics_insights.parser import ParserTestCase, ParserTestSuite, parse_testcase
+
+
+def test_parse_test_suite() -> None:
+    """Test parsing a testsuite tag."""
+    test_suite = ParserTestSuite(
+        ET.fromstring(
+            '<testsuite name="suite" tests="6" errors="1" failures="2" skip="1"'
+            ' time="1.5" timestamp="2023-08-25T15:52:16"/>'
+        )
+    ).parse()
+
+    assert test_suite.name == "suite"
+    assert test_suite.tests == 6
+    assert test_suite.errors == 1
+    assert test_suite.failures == 2
+    assert test_suite.skipped == 1
+    assert test_suite.passed == 2
+    assert test_suite.execution_time == 1.5
+    assert test_suite.timestamp == "2023-08-25T15:52:16"
+
+
+def test_parse_test_suite_without_attributes() -> None:
+    """Test parsing a testsuite tag without attributes."""
+    test_suite = ParserTestSuite(ET.fromstring("<testsuite/>")).parse()
+
+    assert test_suite.name == ""
+    assert test_suite.tests == 0
+    assert test_suite.skipped == 0
+    assert test_suite.execution_time == 0.0
+
+
+def test_parse_test_suite_with_empty_attributes() -> None:
+    """Test parsing a testsuite tag with empty numeric attributes."""
+    test_suite = ParserTestSuite(
+        ET.fromstring('<testsuite tests="" errors="" failures="" time=""/>')
+    ).parse()
+
+    assert test_suite.tests == 0
+    assert test_suite.errors == 0
+    assert test_suite.failures == 0
+    assert test_suite.execution_time == 0.0
+
+
+def test_parse_test_case() -> None:
+    """Test parsing a testcase tag."""
+    test_case = ParserTestCase(
+        ET.fromstring(
+            '<testcase classname="package.module.TestClass" name="test" time="0.5">'
+            '<failure message="AssertionError: 1 != 2&#10;details">trace</failure>'
+            "<system-out>20240823 20:38:03 - INFO - output</system-out>"
+            "</testcase>"
+        )
+    ).parse()
+
+    assert test_case.name == "test"
+    assert test_case.test_module == "module"
+    assert test_case.test_class == "TestClass"
+    assert test_case.execution_time == 0.5
+    assert test_case.result == "failed"
+    assert test_case.failure_reason == "AssertionError: 1 != 2"
+    assert test_case.error_reason is None
+    assert test_case.timestamp == "20240823 20:38:03"
+    assert test_case.system_out == "20240823 20:38:03 - INFO - output"
+
+
+@pytest.mark.parametrize(
+    "inner_xml, expected",
+    [
+        ("", "passed"),
+        ("<system-out>output</system-out>", "passed"),
+        ('<failure message="x">d</failure>', "failed"),
+        ('<error message="x">d</error>', "error"),
+        ('<skipped message="x">d</skipped>', "skipped"),
+        ('<error message="x"/><skipped message="x"/>', "skipped"),
+        ('<error message="x"/><failure message="x"/>', "failed"),
+    ],
+)
+def test_get_testcase_result(inner_xml: str, expected: str) -> None:
+    """Test the result of a test case is parsed from its children."""
+    test_case = ET.fromstring(f"<testcase name='test'>{inner_xml}</testcase>")
+
+    assert ParserTestCase(test_case).get_testcase_result() == expected
+
+
+def test_get_failure_reason_from_error() -> None:
+    """Test the error reason is parsed from the error tag."""
+    test_case = ParserTestCase(
+        ET.fromstring('<testcase name="test"><error message="Boom"/></testcase>')
+    ).parse()
+
+    assert test_case.result == "error"
+    assert test_case.error_reason == "Boom"
+
+
+@pytest.mark.parametrize(
+    "inner_xml, expected",
+    [
+        (
+            '<failure message="&#10;  AssertionError: 1 != 2  &#10;-- log --&#10;x"/>',
+            "AssertionError: 1 != 2",
+        ),
+        ("<failure/>", None),
+    ],
+)
+def test_get_failure_reason(inner_xml: str, expected: Optional[str]) -> None:
+    """Test the failure reason is the first line of the failure message."""
+    test_case = ET.fromstring(f"<testcase name='test'>{inner_xml}</testcase>")
+
+    assert ParserTestCase(test_case).get_failure_reason() == expected
+
+
+@pytest.mark.parametrize(
+    "inner_xml, expected",
+    [('<skipped message="Not supported"/>', "Not supported"), ("<skipped/>", None)],
+)
+def test_get_skipped_reason(inner_xml: str, expected: Optional[str]) -> None:
+    """Test the skipped reason is parsed from the skipped tag."""
+    test_case = ET.fromstring(f"<testcase name='test'>{inner_xml}</testcase>")
+
+    assert ParserTestCase(test_case).get_skipped_reason() == expected
+
+
+def test_find_tag_attribute_uses_first_tag() -> None:
+    """Test the first of several tags with the same name is used."""
+    test_case = ET.fromstring(
+        "<testcase name='test'>"
+        "<system-out>first</system-out><system-out>second</system-out>"
+        "</testcase>"
+    )
+
+    assert ParserTestCase(test_case).find_tag_attribute("system-out") == "first"
+
+
+@pytest.mark.parametrize(
+    "inner_xml, expected",
+    [
+        ("<timestamp>2023-08-29T12:00:00</timestamp>", "2023-08-29T12:00:00"),
+        (
+            "<system-out>\n  20240823 20:38:03 - INFO - start\n"
+            "20240823 20:38:04 - INFO - end</system-out>",
+            "20240823 20:38:03",
+        ),
+        ("<system-out>output</system-out>", None),
+    ],
+)
+def test_get_timestamp(inner_xml: str, expected: Optional[str]) -> None:
+    """Test the timestamp is parsed from a timestamp tag or the system-out."""
+    test_case = ET.fromstring(f"<testcase name='test'>{inner_xml}</testcase>")
+
+    assert ParserTestCase(test_case).get_timestamp() == expected
+
+
+def test_get_system_out_without_system_out() -> None:
+    """Test no system out is parsed from a test case without system-out."""
+    test_case = ET.fromstring('<testcase name="test"/>')
+
+    assert ParserTestCase(test_case).get_system_out() is None
+
+
+@pytest.mark.parametrize(
+    "classname, expected_module, expected_class",
+    [
+        ("package.module.TestClass", "module", "TestClass"),
+        ("module.TestClass", "module", "TestClass"),
+        ("TestClass", "", "TestClass"),
+        ("", "", ""),
+    ],
+)
+def test_parse_test_case_classname(
+    classname: str, expected_module: str, expected_class: str
+) -> None:
+    """Test the module and class names are parsed from the classname."""
+    test_case = ParserTestCase(
+        ET.fromstring(f'<testcase classname="{classname}" name="test"/>')
+    ).parse()
+
+    assert test_case.test_module == expected_module
+    assert test_case.test_class == expected_class
+
+
+def test_parse_test_case_interns_names() -> None:
+    """Test test cases of the same class share the module and class names."""
+    test_cases = [
+        ParserTestCase(
+            ET.fromstring(f'<testcase classname="pkg.module.Class" name="{name}"/>')
+        ).parse()
+        for name in ("test_a", "test_b")
+    ]
+
+    assert test_cases[0].test_module is test_cases[1].test_module
+    assert test_cases[0].test_class is test_cases[1].test_class
+
+
+def test_parse_testcase() -> None:
+    """Test parse_testcase parses a testcase tag without ParserTestCase."""
+    test_case = parse_testcase(
+        ET.fromstring(
+            '<testcase classname="module.TestClass" name="test" time="2">'
+            '<skipped message="Not supported"/>'
+            "<timestamp>2023-08-29T12:00:00</timestamp>"
+            "</testcase>"
+        )
+    )
+
+    assert test_case == data_classes.TestCase(
+        name="test",
+        test_module="module",
+        test_class="TestClass",
+        execution_time=2.0,
+        result="skipped",
+        timestamp="2023-08-29T12:00:00",
+        skipped_reason="Not supported",
+    )
@@ -3,39 +3,40 @@
 Unit tests for patch_fetcher.py module.
 """
 
-from xml.etree import ElementTree as ET
+import sys
+from pathlib import Path
 
 import pytest
 
-from qa_analytics_insights.xml_loader import XMLLoader
-from qa_analytics_insights.xml_tag_finder import XMLTagFinder
+from qa_analytics_insights.patch_fetcher import PathFetcher
 
+nosetests_xml = "tests/data/nosetests_test_result.xml"
 
-@pytest.fixture
-def xml_loader() -> XMLLoader:
-    """Returns XMLLoader object."""
-    return XMLLoader("tests/data/pytest_test_result.xml")
 
+def test_fetch_paths_from_directory(tmp_path: Path) -> None:
+    """Test only non-empty XML files are fetched from a directory."""
+    (tmp_path / "result.xml").write_text("<testsuite/>")
+    (tmp_path / "notes.txt").write_text("notes")
+    (tmp_path / "nested.xml").mkdir()
+    (tmp_path / "empty.xml").write_text("")
 
-@pytest.fixture
-def xml_tag_finder(xml_loader: XMLLoader) -> XMLTagFinder:
-    """Returns XMLTagFinder object."""
-    return XMLTagFinder(xml_loader)
+    assert PathFetcher(str(tmp_path)).fetch_paths() == [tmp_path / "result.xml"]
 
 
-def test_test_cases(xml_tag_finder: XMLTagFinder) -> None:
-    """Test test_cases property."""
-    assert isinstance(xml_tag_finder.test_cases, list)
-    assert len(xml_tag_finder.test_cases) == 2
-    assert all(isinstance(tag, ET.Element) for tag in xml_tag_finder.test_cases)
+@pytest.mark.skipif(sys.platform == "win32", reason="Symlinks need privileges.")
+def test_fetch_paths_skips_unreadable_entry(tmp_path: Path) -> None:
+    """Test an entry that cannot be stat'ed does not lose the other files."""
+    (tmp_path / "result.xml").write_text("<testsuite/>")
+    (tmp_path / "loop.xml").symlink_to(tmp_path / "loop.xml")
 
+    assert PathFetcher(str(tmp_path)).fetch_paths() == [tmp_path / "result.xml"]
 
-def test_suite(xml_tag_finder: XMLTagFinder) -> None:
-    """Test suite property."""
-    assert isinstance(xml_tag_finder.suite, ET.Element)
-    assert xml_tag_finder.suite.tag == "testsuite"
 
+def test_fetch_paths_from_file() -> None:
+    """Test a file path is fetched as is."""
+    assert PathFetcher(nosetests_xml).fetch_paths() == [Path(nosetests_xml)]
 
-def test_suite_property(xml_tag_finder: XMLTagFinder) -> None:
-    """Test suite property."""
-    assert xml_tag_finder.suite == xml_tag_finder.root.find("testsuite")
+
+def test_fetch_paths_from_invalid_path(tmp_path: Path) -> None:
+    """Test no paths are fetched from a path that does not exist."""
+    assert PathFetcher(str(tmp_path / "missing")).fetch_paths() == []
@@ -0,0 +1,163 @@
+"""Copyright (c) 2023, Aydin Abdi.
+
+Unit tests for result_analyzer.py module.
+"""
+
+from pathlib import Path
+from typing import List, Optional  # noqa: F401
+
+import pytest
+
+from qa_analytics_insights import data_classes
+from qa_analytics_insights.result_analyzer import ResultAnalyzer
+
+nosetests_xml = "tests/data/nosetests_test_result.xml"
+
+
+@pytest.fixture
+def result_analyzer() -> ResultAnalyzer:
+    """Returns ResultAnalyzer object with test classes of known durations."""
+    result_analyzer = ResultAnalyzer("tests/data")
+    test_classes = [
+        data_classes.TestClass(
+            name=f"Class{i}",
+            test_cases=[data_classes.TestCase(name="test", execution_time=time)],
+        )
+        for i, time in enumerate([3.0, 1.0, 5.0, 2.0, 4.0])
+    ]
+    result_analyzer.suites = [
+        data_classes.TestSuite(name="suite", test_classes=test_classes)
+    ]
+    return result_analyzer
+
+
+def test_get_slowest_test_classes() -> None:
+    """Test get_slowest_test_classes with parsed test results."""
+    result_analyzer = ResultAnalyzer(nosetests_xml)
+
+    slowest_test_classes = result_analyzer.get_slowest_test_classes(3)
+
+    assert [test_class.name for test_class in slowest_test_classes] == [
+        "TestMethodWithTimeStamp",
+        "TestMethod4",
+        "TestMethod3",
+    ]
+
+
+@pytest.mark.parametrize(
+    "num_test_classes, expected",
+    [
+        (1, ["Class2"]),
+        (3, ["Class2", "Class4", "Class0"]),
+        (5, ["Class2", "Class4", "Class0", "Class3", "Class1"]),
+        (10, ["Class2", "Class4", "Class0", "Class3", "Class1"]),
+        (0, []),
+    ],
+)
+def test_get_slowest_test_classes_with_limit(
+    result_analyzer: ResultAnalyzer, num_test_classes: int, expected: List[str]
+) -> None:
+    """Test get_slowest_test_classes returns the slowest classes in order."""
+    slowest_test_classes = result_analyzer.get_slowest_test_classes(num_test_classes)
+
+    assert [test_class.name for test_class in slowest_test_classes] == expected
+
+
+def test_get_execution_times_by_test_class_in_descending_order(
+    result_analyzer: ResultAnalyzer,
+) -> None:
+    """Test the test classes are sorted by execution time."""
+    test_classes = (
+        result_analyzer.get_execution_times_by_test_class_in_descending_order()
+    )
+
+    assert [test_class.execution_time for test_class in test_classes] == [
+        5.0,
+        4.0,
+        3.0,
+        2.0,
+        1.0,
+    ]
+
+
+def test_sorted_test_classes_are_cached(result_analyzer: ResultAnalyzer) -> None:
+    """Test the sorted test classes are cached until results are processed."""
+    test_classes = (
+        result_analyzer.get_execution_times_by_test_class_in_descending_order()
+    )
+
+    assert (
+        result_analyzer.get_execution_times_by_test_class_in_descending_order()
+        is test_classes
+    )
+    result_analyzer.process_test_results()
+    assert (
+        result_analyzer.get_execution_times_by_test_class_in_descending_order()
+        is not test_classes
+    )
+
+
+def test_num_threads_is_deprecated() -> None:
+    """Test num_threads is still accepted as an alias of num_workers."""
+    with pytest.deprecated_call():
+        result_analyzer = ResultAnalyzer(nosetests_xml, num_threads=2)
+
+    assert result_analyzer.num_workers == 2
+    with pytest.deprecated_call():
+        assert result_analyzer.num_threads == 2
+
+
+def test_test_cases_of_several_suites() -> None:
+    """Test every test case is listed once for results with several suites."""
+    result_analyzer = ResultAnalyzer("tests/data")
+    result_analyzer.suites = [
+        data_classes.TestSuite(
+            name=f"suite{i}",
+            test_cases=[data_classes.TestCase(name=f"ungrouped{i}")],
+            test_classes=[
+                data_classes.TestClass(
+                    name=f"Class{i}",
+                    test_cases=[data_classes.TestCase(name=f"test{i}")],
+                )
+            ],
+        )
+        for i in range(3)
+    ]
+
+    assert [test_case.name for test_case in result_analyzer.test_cases] == [
+        "ungrouped0",
+        "ungrouped1",
+        "ungrouped2",
+        "test0",
+        "test1",
+        "test2",
+    ]
+    assert len(result_analyzer) == 6
+
+
+def test_empty_results_are_processed_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test results without test suites are not processed on every access."""
+    result_analyzer = ResultAnalyzer(str(tmp_path))
+    calls = []  # type: List[Optional[int]]
+    monkeypatch.setattr(
+        result_analyzer.processor, "process_files_in_parallel", calls.append
+    )
+
+    assert result_analyzer.suites == []
+    assert result_analyzer.classes == []
+    assert result_analyzer.test_cases == []
+    assert len(calls) == 1
+
+
+def test_process_test_results_twice() -> None:
+    """Test processing again replaces the test suites instead of adding to them."""
+    result_analyzer = ResultAnalyzer("tests/data", num_workers=2)
+    suites = result_analyzer.suites
+    num_classes = len(result_analyzer.classes)
+
+    result_analyzer.process_test_results()
+
+    assert len(result_analyzer.suites) == len(suites) == 3
+    assert len(result_analyzer.classes) == num_classes
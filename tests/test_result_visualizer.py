@@ -0,0 +1,263 @@
+"""Copyright (c) 2023, Aydin Abdi.
+
+Unit tests for result_visualizer.py module.
+"""
+
+import base64
+from pathlib import Path
+from typing import List
+
+import pytest
+from matplotlib.figure import Figure
+
+from qa_analytics_insights import data_classes
+from qa_analytics_insights.result_visualizer import (
+    ParallelResultVisualizer,
+    ResultVisualizer,
+    html_table,
+    svg_bar_chart,
+)
+from qa_analytics_insights.xml_processor import parse_xml_file
+
+nosetests_xml = "tests/data/nosetests_test_result.xml"
+
+
+@pytest.fixture(scope="module")
+def test_suites() -> List[data_classes.TestSuite]:
+    """Returns the test suites parsed from the nosetests result, shared read-only."""
+    return [parse_xml_file(nosetests_xml)]
+
+
+@pytest.fixture(scope="module")
+def visualizer(test_suites: List[data_classes.TestSuite]) -> ResultVisualizer:
+    """Returns a visualizer of the test suites, shared by the read-only tests."""
+    return ResultVisualizer(test_suites)
+
+
+def test_figure_to_base64(visualizer: ResultVisualizer) -> None:
+    """Test a figure is converted to a base64 encoded PNG."""
+    figure = visualizer.plot_pie_charts_test_classes()
+
+    assert figure is not None
+    png = base64.b64decode(ResultVisualizer.figure_to_base64(figure))
+    assert png.startswith(b"\x89PNG")
+
+
+def test_generate_html_plots(
+    test_suites: List[data_classes.TestSuite], tmp_path: Path
+) -> None:
+    """Test the HTML report is generated with all figures."""
+    output = tmp_path / "report"
+    slowest_test_classes = test_suites[0].test_classes[:3]
+
+    ParallelResultVisualizer(test_suites).generate_html_plots(
+        str(output), slowest_test_classes
+    )
+
+    html = (tmp_path / "report.html").read_text()
+    assert "Test Suites Summary" in html
+    assert "base64,None" not in html
+    assert html.count("<table") == 3
+    assert html.count("data:image/png;base64,") == 1
+    assert html.count("<svg") == 1
+
+
+def test_pie_charts_have_one_axes_per_test_class(
+    visualizer: ResultVisualizer,
+) -> None:
+    """Test no unused axes are added to the pie charts grid."""
+    pie_charts = visualizer.plot_pie_charts_test_classes()
+
+    assert pie_charts is not None
+    assert len(pie_charts.axes) == len(visualizer.test_classes)
+    for ax, test_class in zip(pie_charts.axes, visualizer.test_classes):
+        legend = ax.get_legend()
+        assert legend is not None
+        assert [text.get_text() for text in legend.get_texts()] == [
+            f"skipped ({test_class.skipped})",
+            f"failed ({test_class.failed})",
+            f"passed ({test_class.passed})",
+            f"error ({test_class.errors})",
+        ]
+
+
+def test_figures_are_not_registered_in_pyplot(visualizer: ResultVisualizer) -> None:
+    """Test the figures are created without the pyplot state machine."""
+    pie_charts = visualizer.plot_pie_charts_test_classes()
+
+    assert pie_charts is not None
+    # Only figures created by pyplot get a figure manager of a GUI backend
+    assert pie_charts.canvas.manager is None
+
+
+def test_html_table() -> None:
+    """Test table cells are escaped and None cells are left empty."""
+    table = html_table(("Name", "Reason"), [("test_<a>", None), ("test_b", 1.5)])
+
+    assert "<th>Name</th><th>Reason</th>" in table
+    assert "<tr><td>test_&lt;a&gt;</td><td></td></tr>" in table
+    assert "<tr><td>test_b</td><td>1.5</td></tr>" in table
+
+
+def test_build_failed_table_html(visualizer: ResultVisualizer) -> None:
+    """Test the failed test cases table lists every failed or error test case."""
+    failed_test_cases = [
+        test_case
+        for test_case in visualizer.test_cases
+        if test_case.result in (data_classes.FAILED, data_classes.ERROR)
+    ]
+
+    table = visualizer.build_failed_table_html()
+
+    assert table is not None
+    assert table.count("<tr>") == len(failed_test_cases)
+
+
+def test_build_table_html_without_test_suites() -> None:
+    """Test no tables are built without test suites."""
+    visualizer = ResultVisualizer()
+
+    assert visualizer.build_failed_table_html() is None
+    assert visualizer.build_skipped_table_html() is None
+    assert visualizer.build_test_suites_summary_table_html() is None
+
+
+def test_test_cases_include_ungrouped_and_class_test_cases() -> None:
+    """Test the test cases of all suites and classes are listed once."""
+    test_suites = [
+        data_classes.TestSuite(
+            name=f"suite{i}",
+            test_cases=[data_classes.TestCase(name=f"ungrouped{i}")],
+            test_classes=[
+                data_classes.TestClass(
+                    name=f"Class{i}",
+                    test_cases=[data_classes.TestCase(name=f"test{i}")],
+                )
+            ],
+        )
+        for i in range(2)
+    ]
+    visualizer = ResultVisualizer(test_suites)
+
+    assert [test_class.name for test_class in visualizer.test_classes] == [
+        "Class0",
+        "Class1",
+    ]
+    assert [test_case.name for test_case in visualizer.test_cases] == [
+        "ungrouped0",
+        "ungrouped1",
+        "test0",
+        "test1",
+    ]
+
+
+def test_svg_bar_chart() -> None:
+    """Test the bars are scaled to the slowest and the labels are escaped."""
+    svg = svg_bar_chart([("Test<A>", 4.0), ("TestB", 1.0)])
+
+    assert svg.startswith("<svg")
+    assert ">Test&lt;A&gt;</text>" in svg
+    assert svg.count("<rect") == 2
+    assert 'width="500.0"' in svg
+    assert 'width="125.0"' in svg
+
+
+def test_build_top_slowest_test_classes_svg_without_classes() -> None:
+    """Test no bar chart is built without slowest test classes."""
+    assert ResultVisualizer().build_top_slowest_test_classes_svg([]) is None
+
+
+def test_generate_html_report_to_file_without_figures(tmp_path: Path) -> None:
+    """Test the report is written with empty sections when nothing is given."""
+    output = tmp_path / "report"
+
+    ResultVisualizer.generate_html_report_to_file(str(output))
+
+    html = (tmp_path / "report.html").read_text()
+    assert html.startswith("<!DOCTYPE html>")
+    assert html.rstrip().endswith("</html>")
+    assert "<img" not in html
+    assert html.count("<h2>") == 5
+
+
+def test_test_case_rows_are_collected_once(
+    test_suites: List[data_classes.TestSuite],
+) -> None:
+    """Test the failed and skipped rows are built from a single pass."""
+    visualizer = ResultVisualizer(test_suites)
+
+    failed_rows = visualizer.failed_test_cases_rows()
+    skipped_rows = visualizer.skipped_test_cases_rows()
+
+    assert visualizer.failed_test_cases_rows() is failed_rows
+    assert visualizer.skipped_test_cases_rows() is skipped_rows
+    assert len(failed_rows) == sum(
+        test_suite.failures + test_suite.errors for test_suite in test_suites
+    )
+    assert len(skipped_rows) == sum(test_suite.skipped for test_suite in test_suites)
+
+
+def test_test_suites_summary_rows_totals() -> None:
+    """Test the total and failure rate rows sum up every test suite."""
+    test_suites = [
+        data_classes.TestSuite(
+            name="suite1", tests=4, failures=1, errors=1, execution_time=1.5
+        ),
+        data_classes.TestSuite(name="suite2", tests=4, skipped=2, execution_time=0.5),
+    ]
+
+    rows = ResultVisualizer(test_suites).test_suites_summary_rows()
+
+    assert rows[2] == ("Total", 8, 4, 1, 2, 1, 2.0)
+    assert rows[3][:2] == ("Failure rate", "25.0%")
+
+
+def test_figure_to_base64_reuses_buffer(visualizer: ResultVisualizer) -> None:
+    """Test a smaller figure is not followed by the bytes of a larger one."""
+    large = visualizer.plot_pie_charts_test_classes()
+    small = Figure(figsize=(1, 1))
+
+    assert large is not None
+    ResultVisualizer.figure_to_base64(large)
+    png = base64.b64decode(ResultVisualizer.figure_to_base64(small))
+
+    assert png.startswith(b"\x89PNG")
+    assert png.endswith(b"IEND\xaeB`\x82")
+
+
+def test_run_without_slowest_classes(
+    visualizer: ResultVisualizer, tmp_path: Path
+) -> None:
+    """Test the report is generated when no slowest test classes are given."""
+    output = tmp_path / "report"
+
+    visualizer.run(str(output), failed_table=True)
+
+    html = (tmp_path / "report.html").read_text()
+    assert html.count("<table") == 1
+    assert "<svg" not in html
+
+
+def test_run_includes_the_selected_sections(
+    visualizer: ResultVisualizer, tmp_path: Path
+) -> None:
+    """Test only the sections switched on are included in the report."""
+    output = tmp_path / "report"
+
+    visualizer.run(str(output), pie_charts=True, summary_table=True)
+
+    html = (tmp_path / "report.html").read_text()
+    assert html.count("<table") == 1
+    assert "Test Suite</th>" in html
+    assert html.count("data:image/png;base64,") == 1
+
+
+def test_pie_charts_are_rendered_once(
+    test_suites: List[data_classes.TestSuite], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the pie charts are rendered once per visualizer."""
+    visualizer = ResultVisualizer(test_suites)
+    pie_charts = visualizer.build_subplots_pie_chart_test_classes_results()
+    monkeypatch.setattr(visualizer, "plot_pie_charts_test_classes", pytest.fail)
+
+    assert visualizer.build_subplots_pie_chart_test_classes_results() is pie_charts
@@ -2,21 +2,88 @@
 
 from pathlib import Path
 from queue import Queue
+from typing import List, Union
+
+import pytest
+from loguru import logger
 
 from qa_analytics_insights.xml_filter import XMLFilter
 
+nosetests_xml = Path("tests/data/nosetests_test_result.xml")
+text_file = Path("tests/data/text.txt")
+
+
+def path_queue(*paths: Path) -> "Queue[Path]":
+    """Returns a queue of the given paths."""
+    queue = Queue()  # type: Queue[Path]
+    for path in paths:
+        queue.put(path)
+    return queue
 
-def test_filter_xml() -> None:
-    """
-    Test the filter_xml method of XMLFilter.
 
-    Args:
-        xml_filter_instance (XMLFilter): An instance of XMLFilter.
-    """
-    path_queue = Queue()
-    path_queue.put(Path("tests/data/nosetests_test_result.xml"))
-    path_queue.put(Path("tests/data/text.txt"))
-    xml_filter = XMLFilter(path_queue)
-    xml_queue = xml_filter.filter_xml()
-    assert xml_queue.get() == Path("tests/data/nosetests_test_result.xml")
+@pytest.mark.parametrize(
+    "paths",
+    [path_queue(text_file, nosetests_xml), [text_file, nosetests_xml]],
+    ids=["queue", "list"],
+)
+def test_filter_xml(paths: Union["Queue[Path]", List[Path]]) -> None:
+    """Test filter_xml queues the XML files of a path queue or list."""
+    xml_queue = XMLFilter(paths).filter_xml()
+    assert xml_queue.get() == nosetests_xml
     assert xml_queue.empty()
+
+
+def test_filter_xml_list() -> None:
+    """Test filter_xml_list returns the XML files in their given order."""
+    pytest_xml = Path("tests/data/pytest_test_result.xml")
+    xml_filter = XMLFilter([pytest_xml, text_file, nosetests_xml])
+    assert xml_filter.filter_xml_list() == [pytest_xml, nosetests_xml]
+
+
+def test_filter_xml_list_skips_other_xml_files(tmp_path: Path) -> None:
+    """Test XML files that are not JUnit XML reports are skipped."""
+    (tmp_path / "empty.xml").write_bytes(b"")
+    (tmp_path / "config.xml").write_bytes(b"<?xml version='1.0'?><configuration/>")
+    (tmp_path / "report.xml").write_bytes(b"<?xml version='1.0'?><testsuites/>")
+    xml_filter = XMLFilter(
+        [
+            tmp_path / "empty.xml",
+            tmp_path / "config.xml",
+            tmp_path / "report.xml",
+            tmp_path / "missing.xml",
+        ]
+    )
+    assert xml_filter.filter_xml_list() == [tmp_path / "report.xml"]
+
+
+def test_filter_xml_list_reads_root_tag_after_long_prolog(tmp_path: Path) -> None:
+    """Test JUnit XML reports are kept when the header has no JUnit tag."""
+    comment = "<!--" + "x" * 8192 + "-->"
+    (tmp_path / "commented.xml").write_text(f"{comment}<testsuite/>")
+    (tmp_path / "config.xml").write_text(f"{comment}<configuration/>")
+    (tmp_path / "utf16.xml").write_text(
+        "<?xml version='1.0' encoding='utf-16'?><testsuites/>", encoding="utf-16"
+    )
+    xml_filter = XMLFilter(
+        [tmp_path / "commented.xml", tmp_path / "config.xml", tmp_path / "utf16.xml"]
+    )
+    assert xml_filter.filter_xml_list() == [
+        tmp_path / "commented.xml",
+        tmp_path / "utf16.xml",
+    ]
+
+
+def test_filter_xml_list_logs_skipped_files(tmp_path: Path) -> None:
+    """Test the skipped files are logged at debug level."""
+    (tmp_path / "config.xml").write_bytes(b"<configuration/>")
+    messages = []  # type: List[str]
+    handler_id = logger.add(messages.append, level="DEBUG", format="{message}")
+    try:
+        XMLFilter([text_file, tmp_path / "config.xml"]).filter_xml_list()
+    finally:
+        logger.remove(handler_id)
+
+    assert messages == [
+        f"Skipped non-XML file: {text_file}\n",
+        f"Skipped non-JUnit XML file: {tmp_path / 'config.xml'}\n",
+    ]
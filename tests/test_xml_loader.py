@@ -3,26 +3,14 @@
 Unit tests for xml_loader.py module.
 """
 
+import warnings
+from pathlib import Path
 from xml.etree import ElementTree as ET
 
-import pytest
-
 from qa_analytics_insights.xml_loader import XMLLoader
 from qa_analytics_insights.xml_tag_finder import XMLTagFinder
 
 
-@pytest.fixture
-def xml_loader() -> XMLLoader:
-    """Returns XMLLoader object."""
-    return XMLLoader("tests/data/pytest_test_result.xml")
-
-
-@pytest.fixture
-def xml_tag_finder(xml_loader: XMLLoader) -> XMLTagFinder:
-    """Returns XMLTagFinder object."""
-    return XMLTagFinder(xml_loader)
-
-
 def test_test_cases(xml_tag_finder: XMLTagFinder) -> None:
     """Test test_cases property."""
     assert isinstance(xml_tag_finder.test_cases, list)
@@ -34,3 +22,51 @@ def test_suite(xml_tag_finder: XMLTagFinder) -> None:
     """Test suite property."""
     assert isinstance(xml_tag_finder.suite, ET.Element)
     assert xml_tag_finder.suite.tag == "testsuite"
+
+
+def test_root_uses_c_accelerator(xml_loader: XMLLoader) -> None:
+    """Test the XML tree is built by the C accelerated ElementTree."""
+    assert not isinstance(xml_loader.root, ET._Element_Py)  # type: ignore
+
+
+def test_iter_testcases(xml_loader: XMLLoader) -> None:
+    """Test iter_testcases streams the testcase elements."""
+    names = [testcase.get("name") for testcase in xml_loader.iter_testcases()]
+    assert names == ["test_filter_xml", "test_parse_xml"]
+    assert xml_loader.suite is not None
+    assert xml_loader.suite.tag == "testsuite"
+    assert xml_loader.suite.get("name") == "qa-analytics-insights"
+    assert xml_loader.suite.find("testcase") is None
+
+
+def test_iter_testcases_with_suite_root() -> None:
+    """Test iter_testcases uses the root element when it is the suite."""
+    xml_loader = XMLLoader("tests/data/nosetests_test_result.xml")
+    assert len(list(xml_loader.iter_testcases())) == 6
+    assert xml_loader.suite is not None
+    assert xml_loader.suite.get("name") == "nosetests"
+
+
+def test_root_of_empty_suite_is_loaded_once(tmp_path: Path) -> None:
+    """Test the cached root is not tested for truth, which is deprecated."""
+    xml_path = tmp_path / "empty.xml"
+    xml_path.write_text('<testsuite name="empty" tests="0"/>')
+    xml_loader = XMLLoader(str(xml_path))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        assert xml_loader.root is xml_loader.root
+
+
+def test_iter_testcases_nested_suite_in_suite_root(tmp_path: Path) -> None:
+    """Test a testsuite root is the suite even if it nests another testsuite."""
+    xml_file = tmp_path / "result.xml"
+    xml_file.write_bytes(
+        b"<testsuite name='outer'><testsuite name='inner'>"
+        b"<testcase name='a'/></testsuite></testsuite>"
+    )
+    xml_loader = XMLLoader(str(xml_file))
+
+    assert [tag.get("name") for tag in xml_loader.iter_testcases()] == ["a"]
+    assert xml_loader.suite is not None
+    assert xml_loader.suite.get("name") == "outer"
@@ -3,6 +3,8 @@
 Unit-tests for the xml_parser module.
 """
 
+import pytest
+
 from qa_analytics_insights.xml_loader import XMLLoader
 from qa_analytics_insights.xml_parser import XMLParser
 from qa_analytics_insights.xml_tag_finder import XMLTagFinder
@@ -44,3 +46,17 @@ def test_parse_with_nosetests_xml():
     assert len(test_suite.test_classes) == 5
     assert len(test_suite.test_cases) == 1
     assert test_suite.passed == 3
+
+
+def test_deprecated_attributes() -> None:
+    """Tests the attributes resolved in __init__ are still available, deprecated."""
+    parser = XMLParser(XMLTagFinder(XMLLoader(pytests_xml)))
+
+    with pytest.deprecated_call():
+        assert parser.root.tag == "testsuites"
+    with pytest.deprecated_call():
+        assert len(parser.test_case_tags) == 2
+    with pytest.deprecated_call():
+        assert parser.suite_tag.get("name") == "qa-analytics-insights"
+    with pytest.deprecated_call():
+        assert parser.suite_parser.parse().name == "qa-analytics-insights"
@@ -0,0 +1,147 @@
+"""Copyright (c) 2023, Aydin Abdi.
+
+Unit tests for xml_processor.py module.
+"""
+
+import shutil
+import sys
+import threading
+from pathlib import Path
+from typing import List  # noqa: F401
+
+import pytest
+
+from qa_analytics_insights import data_classes
+from qa_analytics_insights.xml_processor import (
+    XMLProcessor,
+    parse_xml_file,
+    parse_xml_files,
+    process_pool_context,
+)
+
+
+def test_parse_xml_file() -> None:
+    """Test parse_xml_file parses a single XML file."""
+    test_suite = parse_xml_file("tests/data/pytest_test_result.xml")
+
+    assert test_suite.name == "qa-analytics-insights"
+    assert len(test_suite.test_classes) == 2
+
+
+def test_parse_xml_files(tmp_path: Path) -> None:
+    """Test a batch keeps the other files when one cannot be parsed."""
+    invalid_xml = tmp_path / "invalid.xml"
+    invalid_xml.write_text("<testsuite>")
+
+    results = parse_xml_files([invalid_xml, Path("tests/data/pytest_test_result.xml")])
+
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], data_classes.TestSuite)
+    assert results[1].name == "qa-analytics-insights"
+
+
+def test_process_single_file() -> None:
+    """Test processing a single XML file."""
+    processor = XMLProcessor("tests/data/nosetests_test_result.xml")
+    processor.process_files_in_parallel(num_workers=2)
+
+    assert [test_suite.name for test_suite in processor.test_suites] == ["nosetests"]
+
+
+def test_process_directory() -> None:
+    """Test processing all XML files of a directory."""
+    processor = XMLProcessor("tests/data")
+    processor.process_files_in_parallel(num_workers=2)
+
+    assert sorted(str(test_suite.name) for test_suite in processor.test_suites) == [
+        "nosetests",
+        "nosetests",
+        "qa-analytics-insights",
+    ]
+
+
+def test_process_directory_with_invalid_file(tmp_path: Path) -> None:
+    """Test an XML file that cannot be parsed does not stop the processing."""
+    shutil.copy("tests/data/pytest_test_result.xml", tmp_path / "valid.xml")
+    (tmp_path / "invalid.xml").write_text("<testsuite>")
+    processor = XMLProcessor(str(tmp_path))
+    processor.process_files_in_parallel(num_workers=2)
+
+    assert [test_suite.name for test_suite in processor.test_suites] == [
+        "qa-analytics-insights"
+    ]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="No forkserver on Windows.")
+def test_process_pool_context() -> None:
+    """Test the worker processes are started by a fork server."""
+    context = process_pool_context()
+
+    assert context is not None
+    assert context.get_start_method() == "forkserver"
+
+
+def test_process_directory_without_xml_files(tmp_path: Path) -> None:
+    """Test no workers are needed for a directory without XML files."""
+    (tmp_path / "result.txt").write_text("<testsuite/>")
+    processor = XMLProcessor(str(tmp_path))
+    processor.process_files_in_parallel(num_workers=2)
+
+    assert processor.test_suites == []
+
+
+def test_process_xml(tmp_path: Path) -> None:
+    """Test the files are parsed and the ones that cannot be parsed are skipped."""
+    invalid_xml = tmp_path / "invalid.xml"
+    invalid_xml.write_text("<testsuite>")
+    processor = XMLProcessor("tests/data")
+
+    processor._process_xml([Path("tests/data/pytest_test_result.xml"), invalid_xml])
+
+    assert [test_suite.name for test_suite in processor.test_suites] == [
+        "qa-analytics-insights"
+    ]
+
+
+def test_process_invalid_single_file(tmp_path: Path) -> None:
+    """Test a single XML file that cannot be parsed is skipped."""
+    invalid_xml = tmp_path / "invalid.xml"
+    invalid_xml.write_text("<testsuite>")
+    processor = XMLProcessor(str(invalid_xml))
+    processor.process_files_in_parallel(num_workers=2)
+
+    assert processor.test_suites == []
+
+
+def test_process_single_file_in_calling_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a single XML file is parsed without starting worker threads."""
+    processor = XMLProcessor("tests/data/nosetests_test_result.xml")
+    threads = []  # type: List[threading.Thread]
+    monkeypatch.setattr(
+        processor,
+        "_process_xml",
+        lambda xml_paths: threads.append(threading.current_thread()),
+    )
+
+    processor.process_files_in_parallel(num_workers=2)
+
+    assert threads == [threading.current_thread()]
+
+
+def test_process_largest_files_first(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the XML files are handed to the workers from the largest down."""
+    (tmp_path / "small.xml").write_text("<testsuite/>")
+    (tmp_path / "large.xml").write_text("<testsuite>" + " " * 100 + "</testsuite>")
+    processor = XMLProcessor(str(tmp_path))
+    dispatched = []  # type: List[List[Path]]
+    monkeypatch.setattr(
+        processor,
+        "_process_xml_files_in_processes",
+        lambda xml_paths, num_workers: dispatched.append(xml_paths),
+    )
+
+    processor.process_files_in_parallel(num_workers=2)
+
+    assert dispatched == [[tmp_path / "large.xml", tmp_path / "small.xml"]]
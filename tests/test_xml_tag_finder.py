@@ -3,6 +3,8 @@
 Unit tests for XMLTagFinder class.
 """
 
+from pathlib import Path
+from typing import List
 from xml.etree import ElementTree as ET
 
 import pytest
@@ -11,18 +13,6 @@ from qa_analytics_insights.xml_loader import XMLLoader
 from qa_analytics_insights.xml_tag_finder import XMLTagFinder
 
 
-@pytest.fixture
-def xml_loader() -> XMLLoader:
-    """Returns XMLLoader object."""
-    return XMLLoader("tests/data/pytest_test_result.xml")
-
-
-@pytest.fixture
-def xml_tag_finder(xml_loader: XMLLoader) -> XMLTagFinder:
-    """Returns XMLTagFinder object."""
-    return XMLTagFinder(xml_loader)
-
-
 def test_test_cases(xml_tag_finder: XMLTagFinder) -> None:
     """Test test_cases property."""
     assert isinstance(xml_tag_finder.test_cases, list)
@@ -39,3 +29,61 @@ def test_suite(xml_tag_finder: XMLTagFinder) -> None:
 def test_suite_property(xml_tag_finder: XMLTagFinder) -> None:
     """Test suite property."""
     assert xml_tag_finder.suite == xml_tag_finder.root.find("testsuite")
+
+
+def test_lookups_are_memoized(xml_tag_finder: XMLTagFinder) -> None:
+    """Test the suite and testcase tags are looked up once."""
+    assert xml_tag_finder.suite is xml_tag_finder.suite
+    assert xml_tag_finder.test_cases is xml_tag_finder.test_cases
+
+
+@pytest.mark.parametrize(
+    "xml, names",
+    [
+        (
+            b"<testsuites><testsuite><testcase name='a'/></testsuite></testsuites>",
+            ["a"],
+        ),
+        (b"<testsuite><testcase name='a'/></testsuite>", ["a"]),
+        (b"<testsuites><group><testcase name='a'/></group></testsuites>", ["a"]),
+        (
+            b"<testsuites><testsuite><testcase name='a'/></testsuite>"
+            b"<testsuite><testcase name='b'/></testsuite></testsuites>",
+            ["a", "b"],
+        ),
+        (
+            b"<testsuite><testsuite><testcase name='a'/></testsuite>"
+            b"<testcase name='b'/></testsuite>",
+            ["a", "b"],
+        ),
+    ],
+)
+def test_test_cases_nesting(xml: bytes, names: List[str], tmp_path: Path) -> None:
+    """Test testcase tags are found wherever they are nested."""
+    xml_file = tmp_path / "result.xml"
+    xml_file.write_bytes(xml)
+
+    test_cases = XMLTagFinder(XMLLoader(str(xml_file))).test_cases
+
+    assert [tag.get("name") for tag in test_cases] == names
+
+
+def test_suite_without_children(tmp_path: Path) -> None:
+    """Test an empty testsuite tag is returned instead of the root."""
+    xml_file = tmp_path / "result.xml"
+    xml_file.write_bytes(b"<testsuites><testsuite name='empty'/></testsuites>")
+
+    xml_tag_finder = XMLTagFinder(XMLLoader(str(xml_file)))
+
+    assert xml_tag_finder.suite.get("name") == "empty"
+    assert xml_tag_finder.test_cases == []
+
+
+def test_suite_is_testsuite_root(tmp_path: Path) -> None:
+    """Test a testsuite root is the suite even if it nests another testsuite."""
+    xml_file = tmp_path / "result.xml"
+    xml_file.write_bytes(
+        b"<testsuite name='outer'><testsuite name='inner'/></testsuite>"
+    )
+
+    assert XMLTagFinder(XMLLoader(str(xml_file))).suite.get("name") == "outer"